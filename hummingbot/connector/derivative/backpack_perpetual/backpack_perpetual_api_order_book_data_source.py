@@ -76,7 +76,8 @@ class BackpackPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
                     hb_trading_pair = utils.convert_from_exchange_trading_pair(symbol)
                     
                     if hb_trading_pair in trading_pairs:
-                        last_price = float(ticker.get("lastPrice", 0))
+                        last_price = ticker.get("lastPrice")
+                        last_price = float(last_price) if last_price is not None else 0.0
                         results[hb_trading_pair] = last_price
                     
         except Exception as e:
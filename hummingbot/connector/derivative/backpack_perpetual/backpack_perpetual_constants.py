@@ -101,6 +101,10 @@ TIME_IN_FORCE_MAP = {
 DEFAULT_TIME_IN_FORCE = "GTC"
 DEFAULT_DOMAIN = "backpack_perpetual"
 
+# Error message fragments (matched case-insensitively) meaning the order is unknown to the exchange
+ORDER_NOT_FOUND_ERROR_TOKENS = ("INVALID_ORDER", "RESOURCE_NOT_FOUND", "ORDER NOT FOUND", "UNKNOWN ORDER")
+ORDER_NOT_FOUND_STATUS_ERROR_TOKENS = ORDER_NOT_FOUND_ERROR_TOKENS + ("ORDER DOES NOT EXIST",)
+
 # WebSocket parameters
 WS_HEARTBEAT_INTERVAL = 30  # Send ping every 30 seconds
 WS_HEARTBEAT_TIMEOUT = 60   # Timeout if no pong received in 60 seconds
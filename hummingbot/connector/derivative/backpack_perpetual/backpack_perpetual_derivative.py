@@ -1,8 +1,11 @@
 import asyncio
+import re
 import time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
+from bidict import bidict
+
 from hummingbot.connector.derivative.backpack_perpetual import (
     backpack_perpetual_constants as CONSTANTS,
     backpack_perpetual_utils as utils,
@@ -24,11 +27,24 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+# Case-insensitive error matchers, compiled once so each check is a single scan of the message
+_ORDER_NOT_FOUND_ERROR_RE = re.compile(
+    "|".join(map(re.escape, CONSTANTS.ORDER_NOT_FOUND_ERROR_TOKENS)), re.IGNORECASE)
+_ORDER_NOT_FOUND_STATUS_ERROR_RE = re.compile(
+    "|".join(map(re.escape, CONSTANTS.ORDER_NOT_FOUND_STATUS_ERROR_TOKENS)), re.IGNORECASE)
+# Matches "timestamp", "clock skew", or "time" and "sync" in either order
+_TIME_SYNC_ERROR_RE = re.compile(r"timestamp|clock skew|time.*sync|sync.*time", re.IGNORECASE | re.DOTALL)
+# Seconds before the traceback of a repeating trading rules error is logged again
+_TRACEBACK_LOG_INTERVAL = 60.0
+# Shared Decimal zero, so trading rule refreshes do not parse a new one per market
+_DECIMAL_ZERO = Decimal("0")
+
 
 class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
     """
@@ -50,6 +66,18 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         self._trading_pairs = trading_pairs or []
         self._trading_required = trading_required
         self._position_mode = PositionMode.ONEWAY  # Default to ONEWAY mode
+        # (path, is auth required) -> URL from the perpetual web utils, filled by _rest_url
+        self._rest_url_cache: Dict[Tuple[str, bool], str] = {}
+        # Created on the first request and reused afterwards
+        self._rest_assistant: Optional[RESTAssistant] = None
+        # Trading rules error key -> monotonic time of its last logged traceback
+        self._last_traceback_log_times: Dict[str, float] = {}
+        # (side, is maker) -> default fee; fees are not fetched from the exchange, so they never change
+        self._default_fees: Dict[Tuple[TradeType, bool], TradeFeeBase] = {
+            (order_side, is_maker): utils.parse_trade_fee({}, order_side, is_maker)
+            for order_side in (TradeType.BUY, TradeType.SELL)
+            for is_maker in (True, False)
+        }
         
         super().__init__(client_config_map)
 
@@ -187,7 +215,10 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         Get fee for the order
         """
         # For perpetuals, fees are usually in the quote currency
-        return utils.parse_trade_fee({}, order_side, is_maker)
+        fee = self._default_fees.get((order_side, bool(is_maker)))
+        if fee is None:
+            fee = utils.parse_trade_fee({}, order_side, is_maker)
+        return fee
 
     async def _update_trading_rules(self):
         """Update trading rules from the exchange"""
@@ -197,12 +228,15 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
                 is_auth_required=False
             )
             
+            # Drop malformed, offline and non-perpetual markets up front so the parsing loop only sees tradable ones
+            online_markets = [
+                market for market in markets
+                if isinstance(market, dict) and utils.is_exchange_information_valid(market)
+            ]
+            
             trading_rules_list = []
-            for market in markets:
+            for market in online_markets:
                 try:
-                    if not utils.is_exchange_information_valid(market):
-                        continue
-                        
                     exchange_symbol = market.get("symbol", "")
                     trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
                     
@@ -216,7 +250,7 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
                         min_base_amount_increment=parsed_rules["min_base_amount_increment"],
                         min_quote_amount_increment=parsed_rules["min_quote_amount_increment"],
                         min_notional_size=parsed_rules["min_notional_size"],
-                        min_order_value=Decimal("0"),  # Not provided by Backpack
+                        min_order_value=_DECIMAL_ZERO,  # Not provided by Backpack
                         supports_limit_orders=parsed_rules["supports_limit_orders"],
                         supports_market_orders=parsed_rules["supports_market_orders"],
                     )
@@ -224,21 +258,36 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
                     trading_rules_list.append(trading_rule)
                     
                 except Exception as e:
-                    self.logger().error(
-                        f"Error parsing trading rule for {market.get('symbol', 'unknown')}. "
-                        f"Error: {str(e)}. Market info: {market}",
-                        exc_info=True
+                    self._log_error_with_sampled_traceback(
+                        "parse_trading_rule",
+                        f"Error parsing trading rule for {market.get('symbol', 'unknown')}. Market info: {market}.",
+                        e,
                     )
                     
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
                 self._trading_rules[trading_rule.trading_pair] = trading_rule
+            # Refresh the symbol map from the same payload, as the base class does, instead of a separate fetch
+            self._initialize_trading_pair_symbols_from_exchange_info(markets)
                 
         except Exception as e:
-            self.logger().error(
-                f"Error updating trading rules. Error: {str(e)}",
-                exc_info=True
-            )
+            self._log_error_with_sampled_traceback("update_trading_rules", "Error updating trading rules.", e)
+
+    def _log_error_with_sampled_traceback(self, key: str, message: str, exception: Exception) -> None:
+        """
+        Log a trading rules error, with its traceback only once per _TRACEBACK_LOG_INTERVAL per key
+
+        Perpetual markets are re-parsed on every trading rules poll, so a market the parser rejects
+        fails on each refresh. Every failure is still logged at ERROR level, but its stack is only
+        formatted when the interval for that key has elapsed.
+        """
+        now = time.monotonic()
+        last_traceback_time = self._last_traceback_log_times.get(key)
+        if last_traceback_time is None or now - last_traceback_time >= _TRACEBACK_LOG_INTERVAL:
+            self._last_traceback_log_times[key] = now
+            self.logger().error(f"{message} Error: {exception}", exc_info=exception)
+        else:
+            self.logger().error(f"{message} Error: {exception}")
 
     async def _update_balances(self):
         """Update account balances"""
@@ -282,21 +331,13 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         """
         Check if the error is due to order not found during status update
         """
-        error_message = str(status_update_exception)
-        return (
-            "INVALID_ORDER" in error_message or
-            "RESOURCE_NOT_FOUND" in error_message
-        )
+        return _ORDER_NOT_FOUND_STATUS_ERROR_RE.search(str(status_update_exception)) is not None
 
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
         """
         Check if the error is due to order not found during cancellation
         """
-        error_message = str(cancelation_exception)
-        return (
-            "INVALID_ORDER" in error_message or
-            "RESOURCE_NOT_FOUND" in error_message
-        )
+        return _ORDER_NOT_FOUND_ERROR_RE.search(str(cancelation_exception)) is not None
 
     async def _trading_pair_position_mode_set(self, mode: PositionMode, trading_pairs: List[str]) -> Tuple[bool, str]:
         """
@@ -321,68 +362,74 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         # This is a placeholder - implement when private API is ready
         return 0, Decimal("0"), Decimal("0")
 
-    async def _api_get(self,
-                      path_url: str,
-                      params: Optional[Dict[str, Any]] = None,
-                      is_auth_required: bool = False,
-                      limit_id: Optional[str] = None) -> Any:
-        """Execute GET request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-            
-        return await rest_assistant.execute_request(
-            url=url,
-            throttler_limit_id=limit_id or path_url,
-            params=params,
-            method=RESTMethod.GET,
-            is_auth_required=is_auth_required
-        )
-
-    async def _api_post(self,
-                       path_url: str,
-                       data: Optional[Dict[str, Any]] = None,
-                       is_auth_required: bool = False,
-                       limit_id: Optional[str] = None) -> Any:
-        """Execute POST request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-            
-        return await rest_assistant.execute_request(
-            url=url,
-            throttler_limit_id=limit_id or path_url,
-            data=data,
-            method=RESTMethod.POST,
-            is_auth_required=is_auth_required
-        )
-
-    async def _api_delete(self,
-                         path_url: str,
-                         params: Optional[Dict[str, Any]] = None,
-                         is_auth_required: bool = False,
-                         limit_id: Optional[str] = None) -> Any:
-        """Execute DELETE request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-            
-        return await rest_assistant.execute_request(
-            url=url,
-            throttler_limit_id=limit_id or path_url,
-            params=params,
-            method=RESTMethod.DELETE,
-            is_auth_required=is_auth_required
-        )
+    async def _get_rest_assistant(self) -> RESTAssistant:
+        """Return the shared REST assistant, creating it on the first request"""
+        if self._rest_assistant is None:
+            self._rest_assistant = await self._web_assistants_factory.get_rest_assistant()
+        return self._rest_assistant
+
+    def _rest_url(self, path_url: str, is_auth_required: bool) -> str:
+        """
+        Resolve a path through the perpetual web utils' public or private URL builder, memoized per path
+
+        Replaces the base class _api_request_url, which is async and rebuilds the URL on every call.
+        """
+        key = (path_url, is_auth_required)
+        url = self._rest_url_cache.get(key)
+        if url is None:
+            if is_auth_required:
+                url = web_utils.private_rest_url(path_url, self._domain)
+            else:
+                url = web_utils.public_rest_url(path_url, self._domain)
+            self._rest_url_cache[key] = url
+        return url
+
+    async def _api_request(
+            self,
+            path_url,
+            overwrite_url: Optional[str] = None,
+            method: RESTMethod = RESTMethod.GET,
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Dict[str, Any]] = None,
+            is_auth_required: bool = False,
+            return_err: bool = False,
+            limit_id: Optional[str] = None,
+            headers: Optional[Dict[str, Any]] = None,
+            **kwargs,
+    ) -> Any:
+        """
+        Execute a REST request
+
+        The base class _api_get, _api_post and _api_delete helpers all route here with their method set.
+        Response bodies are decoded with ujson rather than the stdlib decoder used by execute_request.
+        As in the base class, a request rejected for clock drift is retried once after resyncing the time.
+        """
+        last_exception = None
+        rest_assistant = await self._get_rest_assistant()
+        url = overwrite_url or self._rest_url(path_url, is_auth_required)
+
+        for _ in range(2):
+            try:
+                response = await rest_assistant.execute_request_and_get_response(
+                    url=url,
+                    throttler_limit_id=limit_id or path_url,
+                    params=params,
+                    data=data,
+                    method=method,
+                    is_auth_required=is_auth_required,
+                    return_err=return_err,
+                    headers=headers,
+                )
+                return await web_utils.parse_json_response(response)
+            except IOError as request_exception:
+                last_exception = request_exception
+                if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
+                    await self._update_time_synchronizer()
+                else:
+                    raise
+
+        # Failed even after the last retry
+        raise last_exception
 
     def _create_user_stream_data_source(self) -> Optional[UserStreamTrackerDataSource]:
         """
@@ -402,13 +449,7 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         """
         Check if the request exception is related to time synchronization issues
         """
-        error_message = str(request_exception).lower()
-        # Check for common time-related errors
-        return (
-            "timestamp" in error_message or
-            "time" in error_message and "sync" in error_message or
-            "clock skew" in error_message
-        )
+        return _TIME_SYNC_ERROR_RE.search(str(request_exception)) is not None
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         """
@@ -446,13 +487,13 @@ class BackpackPerpetualDerivative(PerpetualDerivativePyBase):
         Initialize trading pair symbols from exchange info
         Maps exchange symbols to standard trading pair format
         """
-        from bidict import bidict
-        
         mapping = bidict()
         
         # For Backpack, the exchange info is a list of markets
         if isinstance(exchange_info, list):
             for market_info in exchange_info:
+                if not isinstance(market_info, dict):
+                    continue
                 exchange_symbol = market_info.get("symbol", "")
                 if exchange_symbol:
                     trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ConfigDict, Field, SecretStr
@@ -21,6 +22,19 @@ CENTRALIZED = True
 
 EXAMPLE_PAIR = "BTC-USDC-PERP"
 
+# Shared stand-in for missing filter sections; only ever read from
+_EMPTY_FILTERS: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=256)
+def _market_decimal(value: str) -> Decimal:
+    """
+    Parse a market info value, caching the result
+
+    Markets share a small set of distinct tick, step and size values, so each is parsed once.
+    """
+    return Decimal(value)
+
 
 def split_trading_pair(trading_pair: str) -> tuple[str, str]:
     """
@@ -82,21 +96,22 @@ def parse_trading_rule(market_info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse trading rule from market info for perpetual contracts
     """
-    filters = market_info.get("filters", {})
-    price_filter = filters.get("price", {})
-    quantity_filter = filters.get("quantity", {})
+    filters = market_info.get("filters") or _EMPTY_FILTERS
+    price_filter = filters.get("price") or _EMPTY_FILTERS
+    quantity_filter = filters.get("quantity") or _EMPTY_FILTERS
     
     # Extract contract multiplier if available
-    contract_multiplier = Decimal(str(market_info.get("contractMultiplier", "1")))
+    contract_multiplier = _market_decimal(str(market_info.get("contractMultiplier", "1")))
+    tick_size = _market_decimal(str(price_filter.get("tickSize", "0.00000001")))
     
     return {
-        "min_order_size": Decimal(str(quantity_filter.get("minQuantity", "0.00000001"))),
-        "max_order_size": Decimal(str(quantity_filter.get("maxQuantity", "999999999"))),
-        "min_price_increment": Decimal(str(price_filter.get("tickSize", "0.00000001"))),
-        "min_base_amount_increment": Decimal(str(quantity_filter.get("stepSize", "0.00000001"))),
-        "min_quote_amount_increment": Decimal(str(price_filter.get("tickSize", "0.00000001"))),
-        "min_notional_size": Decimal(str(filters.get("notional", {}).get("minNotional", "0"))),
-        "max_leverage": Decimal(str(market_info.get("maxLeverage", CONSTANTS.MAX_LEVERAGE))),
+        "min_order_size": _market_decimal(str(quantity_filter.get("minQuantity", "0.00000001"))),
+        "max_order_size": _market_decimal(str(quantity_filter.get("maxQuantity", "999999999"))),
+        "min_price_increment": tick_size,
+        "min_base_amount_increment": _market_decimal(str(quantity_filter.get("stepSize", "0.00000001"))),
+        "min_quote_amount_increment": tick_size,
+        "min_notional_size": _market_decimal(str((filters.get("notional") or _EMPTY_FILTERS).get("minNotional", "0"))),
+        "max_leverage": _market_decimal(str(market_info.get("maxLeverage", CONSTANTS.MAX_LEVERAGE))),
         "contract_multiplier": contract_multiplier,
         "supports_limit_orders": True,
         "supports_market_orders": True,
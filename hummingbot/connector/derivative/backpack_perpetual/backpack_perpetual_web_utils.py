@@ -1,8 +1,10 @@
 from typing import Any, Dict, List, Optional
 
+import ujson
+
 import hummingbot.connector.derivative.backpack_perpetual.backpack_perpetual_constants as CONSTANTS
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTResponse
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -42,6 +44,16 @@ def build_api_factory(
     return api_factory
 
 
+async def parse_json_response(response: RESTResponse) -> Any:
+    """
+    Decode a REST response body using ujson instead of the stdlib json decoder
+    """
+    text = await response.text()
+    if not text or text.isspace():
+        return None
+    return ujson.loads(text)
+
+
 def get_markets_url() -> str:
     """Get markets endpoint URL"""
     return public_rest_url(CONSTANTS.MARKETS_PATH_URL)
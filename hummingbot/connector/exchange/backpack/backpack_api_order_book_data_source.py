@@ -40,6 +40,8 @@ class BackpackAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._trading_pairs = trading_pairs
         self._snapshot_msg: Dict[str, OrderBookMessage] = {}
         self._ws_assistant = None
+        # Stream name (e.g. "trade.SOL_USDC") -> Hummingbot trading pair, filled on first message per stream
+        self._stream_trading_pairs: Dict[str, str] = {}
         
         # Reconnection strategy parameters
         self._reconnect_delay = 1.0  # Start with 1 second delay
@@ -85,7 +87,8 @@ class BackpackAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 hb_trading_pair = utils.convert_from_exchange_trading_pair(symbol)
                 
                 if hb_trading_pair in trading_pairs:
-                    last_price = float(ticker.get("lastPrice", 0))
+                    last_price = ticker.get("lastPrice")
+                    last_price = float(last_price) if last_price is not None else 0.0
                     results[hb_trading_pair] = last_price
                     
         except Exception as e:
@@ -224,6 +227,19 @@ class BackpackAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 channel = self._trade_messages_queue_key
         return channel
 
+    def _trading_pair_from_stream_name(self, stream_name: str) -> str:
+        """
+        Resolve the trading pair of a stream, caching the result since the set of streams is fixed
+        :param stream_name: the stream name, e.g. "depth.SOL_USDC"
+        :return: the trading pair in Hummingbot format
+        """
+        trading_pair = self._stream_trading_pairs.get(stream_name)
+        if trading_pair is None:
+            exchange_symbol = stream_name.rpartition(".")[2]
+            trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
+            self._stream_trading_pairs[stream_name] = trading_pair
+        return trading_pair
+
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         """
         Parse order book diff message and add to queue
@@ -233,8 +249,7 @@ class BackpackAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data = raw_message["data"]
             
             # Extract trading pair from stream name (format: depth.SOL_USDC)
-            exchange_symbol = stream_name.split(".")[-1]
-            trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
+            trading_pair = self._trading_pair_from_stream_name(stream_name)
             
             # Get timestamp from data or use current time
             timestamp = data.get("E", time.time() * 1000) / 1e6  # Convert microseconds to seconds
@@ -254,9 +269,8 @@ class BackpackAPIOrderBookDataSource(OrderBookTrackerDataSource):
             stream_name = raw_message["stream"]
             data = raw_message["data"]
             
-            # Extract trading pair from stream name (format: trades.SOL_USDC)
-            exchange_symbol = stream_name.split(".")[-1]
-            trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
+            # Extract trading pair from stream name (format: trade.SOL_USDC)
+            trading_pair = self._trading_pair_from_stream_name(stream_name)
             
             trade_msg = self._parse_trade_message_data(data, trading_pair)
             message_queue.put_nowait(trade_msg)
@@ -1,6 +1,7 @@
 import asyncio
 import base64
 import logging
+import random
 import time
 from typing import Optional, List, TYPE_CHECKING
 
@@ -63,13 +64,19 @@ class BackpackAPIUserStreamDataSource(UserStreamTrackerDataSource):
     async def listen_for_user_stream(self, output: asyncio.Queue):
         """
         Connects to the user private channel in the exchange using a websocket connection
+        
+        Reconnection attempts back off exponentially with jitter while connecting keeps failing, so an outage
+        is not followed by every client reconnecting in lockstep.
         """
+        reconnect_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
         while True:
+            ws: Optional[WSAssistant] = None
             try:
                 self.logger().info("Connecting to Backpack user stream WebSocket...")
-                ws: WSAssistant = await self._connected_websocket_assistant()
+                ws = await self._connected_websocket_assistant()
                 await self._subscribe_to_user_streams(ws)
                 self.logger().info("Successfully subscribed to Backpack user streams")
+                reconnect_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
                 
                 while True:
                     try:
@@ -82,13 +89,15 @@ class BackpackAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 raise
             except Exception:
                 self.logger().exception(
-                    "Unexpected error while listening to user stream. Retrying after 5 seconds..."
+                    "Unexpected error while listening to user stream. Retrying in about %.1f seconds...",
+                    reconnect_backoff
                 )
             finally:
                 # Clean up
                 if ws:
                     await ws.disconnect()
-                await self._sleep(5)
+                await self._sleep(reconnect_backoff * (0.5 + random.random()))
+                reconnect_backoff = min(reconnect_backoff * 2, CONSTANTS.USER_STREAM_BACKOFF_MAX_SECONDS)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         """
@@ -119,7 +128,7 @@ class BackpackAPIUserStreamDataSource(UserStreamTrackerDataSource):
         # Prepare subscription message
         subscribe_request = {
             "method": "SUBSCRIBE",
-            "params": ["account.orderUpdate"],
+            "params": [CONSTANTS.WS_ORDER_UPDATE_STREAM],
             "signature": [
                 self._auth.api_key,  # verifying key (public key)
                 signature,           # signature
@@ -146,16 +155,15 @@ class BackpackAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 
                 if isinstance(data, dict):
                     # Check if it's a wrapped stream message
-                    if "stream" in data and "data" in data:
-                        stream_name = data["stream"]
-                        stream_data = data["data"]
-                        
-                        if stream_name.startswith("account.orderUpdate"):
+                    stream_name = data.get("stream")
+                    stream_data = data.get("data")
+                    if stream_name is not None and stream_data is not None:
+                        if stream_name.startswith(CONSTANTS.WS_ORDER_UPDATE_STREAM):
                             # Process order update
                             await self._process_order_update(stream_data, output)
                     else:
                         # Handle other message types (errors, etc.)
-                        self.logger().debug(f"Received non-stream message: {data}")
+                        self.logger().debug("Received non-stream message: %s", data)
                         
                 # Update last received time
                 self._last_recv_time = time.time()
@@ -172,7 +180,7 @@ class BackpackAPIUserStreamDataSource(UserStreamTrackerDataSource):
         """
         try:
             # Log the raw order update for debugging
-            self.logger().debug(f"Processing order update: {data}")
+            self.logger().debug("Processing order update: %s", data)
             
             # Convert microseconds to milliseconds for consistency with Hummingbot
             if "E" in data:
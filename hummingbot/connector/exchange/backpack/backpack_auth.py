@@ -1,12 +1,12 @@
 import base64
-import json
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlencode
 
 import nacl.encoding
 import nacl.signing
+import ujson
 from nacl.signing import SigningKey, VerifyKey
 
 from hummingbot.connector.exchange.backpack import backpack_constants as CONSTANTS
@@ -50,7 +50,7 @@ class BackpackAuth(AuthBase):
     def generate_auth_string(
         self,
         instruction: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
         timestamp: Optional[int] = None,
         window: int = CONSTANTS.DEFAULT_REQUEST_WINDOW
     ) -> str:
@@ -58,7 +58,7 @@ class BackpackAuth(AuthBase):
         Generate the authentication string for signing
 
         :param instruction: API instruction type
-        :param params: Request parameters
+        :param params: Request parameters, or a list of parameters per item for batch requests
         :param timestamp: Unix timestamp in milliseconds
         :param window: Request validity window in milliseconds
         :return: String to be signed
@@ -66,23 +66,24 @@ class BackpackAuth(AuthBase):
         if timestamp is None:
             timestamp = int(time.time() * 1000)
 
-        # Start with instruction
-        auth_parts = [f"instruction={instruction}"]
-
-        # Add sorted parameters if provided
-        if params:
-            # Ensure params is a dict (handle JSON string case)
-            if isinstance(params, str):
-                try:
-                    params = json.loads(params)
-                except json.JSONDecodeError:
-                    self._logger.error(f"Failed to parse params JSON: {params}")
-                    params = {}
-            
-            # Sort parameters alphabetically by key
-            if isinstance(params, dict):
-                sorted_params = sorted(params.items())
-                param_string = urlencode(sorted_params)
+        # Ensure params is a dict or list (handle JSON string case)
+        if isinstance(params, str):
+            try:
+                params = ujson.loads(params)
+            except ValueError:
+                self._logger.error(f"Failed to parse params JSON: {params}")
+                params = {}
+
+        # Batch requests (a list of items) repeat the instruction before the parameters of every item
+        items = params if isinstance(params, list) and params else [params]
+        auth_parts = []
+        for item in items:
+            # Start with instruction
+            auth_parts.append(f"instruction={instruction}")
+
+            # Add parameters sorted alphabetically by key
+            if item and isinstance(item, dict):
+                param_string = urlencode(sorted(item.items()))
                 if param_string:
                     auth_parts.append(param_string)
 
@@ -109,8 +110,8 @@ class BackpackAuth(AuthBase):
         instruction = self._get_instruction_for_endpoint(request.url, method)
         
         # Log authentication details for debugging
-        self._logger.debug(f"Authenticating request: URL={request.url}, Method={method}, "
-                          f"Instruction={instruction}")
+        self._logger.debug("Authenticating request: URL=%s, Method=%s, Instruction=%s",
+                           request.url, method, instruction)
 
         # Get parameters from either body or query
         params = None
@@ -119,17 +120,17 @@ class BackpackAuth(AuthBase):
             # If data is a JSON string, parse it back to dict
             if isinstance(params, str):
                 try:
-                    params = json.loads(params)
+                    params = ujson.loads(params)
                     self._logger.debug("Parsed JSON string data to dict for authentication")
-                except json.JSONDecodeError:
+                except ValueError:
                     self._logger.error(f"Failed to parse JSON data: {params}")
                     params = None
         elif request.params:
             params = request.params
             
         # Log parameters for debugging (be careful not to log sensitive data)
-        if params:
-            self._logger.debug(f"Request params: {list(params.keys()) if isinstance(params, dict) else 'non-dict params'}")
+        if params and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Request params: %s", list(params.keys()) if isinstance(params, dict) else "non-dict params")
 
         # Generate auth string and signature
         auth_string = self.generate_auth_string(
@@ -140,7 +141,7 @@ class BackpackAuth(AuthBase):
         )
         
         # Log auth string (without signature) for debugging
-        self._logger.debug(f"Auth string to sign: {auth_string}")
+        self._logger.debug("Auth string to sign: %s", auth_string)
         
         signature = self.get_signature(auth_string)
 
@@ -153,8 +154,7 @@ class BackpackAuth(AuthBase):
         }
         
         # Log headers (without sensitive data) for debugging
-        self._logger.debug(f"Auth headers: API_KEY=<hidden>, "
-                          f"TIMESTAMP={timestamp}, WINDOW={window}")
+        self._logger.debug("Auth headers: API_KEY=<hidden>, TIMESTAMP=%s, WINDOW=%s", timestamp, window)
 
         if request.headers is None:
             request.headers = {}
@@ -233,6 +233,12 @@ class BackpackAuth(AuthBase):
                     return "orderExecute"
                 elif method == 'DELETE':
                     return "orderCancel"
+        elif path.endswith("/orders"):
+            # POST executes a batch of orders, DELETE cancels all open orders
+            if method == 'POST':
+                return "orderExecute"
+            elif method == 'DELETE':
+                return "orderCancelAll"
         
         # Check endpoints in order of specificity (longer paths first)
         sorted_endpoints = sorted(instruction_map.keys(), key=len, reverse=True)
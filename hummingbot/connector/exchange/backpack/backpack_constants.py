@@ -26,12 +26,14 @@ COLLATERAL_PATH_URL = "/api/v1/capital/collateral"
 ORDER_PATH_URL = "/api/v1/order"
 ORDERS_PATH_URL = "/api/v1/orders"
 FILLS_PATH_URL = "/api/v1/fills"
+BATCH_ORDER_PATH_URL = ORDERS_PATH_URL  # POST executes a list of orders
 
 # WebSocket stream names
 WS_DEPTH_STREAM = "depth"
 WS_TICKER_STREAM = "ticker"
 WS_TRADES_STREAM = "trade"
 WS_BOOK_TICKER_STREAM = "bookTicker"
+WS_ORDER_UPDATE_STREAM = "account.orderUpdate"
 
 # Order states mapping
 ORDER_STATE_MAP = {
@@ -44,9 +46,19 @@ ORDER_STATE_MAP = {
     "TriggerFailed": OrderState.FAILED,
 }
 
+# User stream order events that only change the order state (fills are handled separately)
+WS_ORDER_EVENT_STATE_MAP = {
+    "orderAccepted": OrderState.OPEN,
+    "orderCancelled": OrderState.CANCELED,
+    "orderExpired": OrderState.CANCELED,
+}
+
 # Order book states that indicate active trading
 # Based on actual API response: Open, Closed, PostOnly
-ACTIVE_ORDER_BOOK_STATES = ["Open"]
+ACTIVE_ORDER_BOOK_STATES = frozenset({"Open"})
+
+# Market types served by other connectors (perpetuals use backpack_perpetual)
+SKIPPED_MARKET_TYPES = frozenset({"PERP"})
 
 # Rate Limits
 # Using conservative limits as exact values not specified in API doc
@@ -79,6 +91,9 @@ TRADE_TYPE_MAP = {
     TradeType.SELL: "Ask",
 }
 
+# Backpack sides to trade types
+SIDE_TRADE_TYPE_MAP = {side: trade_type for trade_type, side in TRADE_TYPE_MAP.items()}
+
 # Time in force
 TIME_IN_FORCE_MAP = {
     "GTC": "GTC",  # Good Till Cancelled
@@ -90,6 +105,38 @@ TIME_IN_FORCE_MAP = {
 DEFAULT_TIME_IN_FORCE = "GTC"
 DEFAULT_DOMAIN = "backpack"
 
+# REST retry parameters (only idempotent GET requests are retried)
+API_MAX_RETRIES = 3
+API_RETRY_BACKOFF_SECONDS = 1.0
+RATE_LIMIT_HTTP_STATUS = 429
+RETRYABLE_HTTP_STATUSES = frozenset({RATE_LIMIT_HTTP_STATUS, 500, 502, 503, 504})
+# Upper bound of the shared backoff window opened after successive rate limit errors
+RATE_LIMIT_MAX_BACKOFF_SECONDS = 30.0
+
+# User stream retry backoff: doubles (with jitter) on consecutive errors, resets after a success
+USER_STREAM_BACKOFF_MIN_SECONDS = 1.0
+USER_STREAM_BACKOFF_MAX_SECONDS = 60.0
+
+# Seconds a markets response is reused for trading rules and the trading pair symbol map
+MARKETS_CACHE_TTL = 30
+
+# Concurrent order status/fill queries during a status update (matches the order endpoints' per-second limit)
+ORDER_STATUS_MAX_CONCURRENT_REQUESTS = 10
+
+# Error message fragments (matched case-insensitively) meaning the order is unknown to the exchange
+ORDER_NOT_FOUND_ERROR_TOKENS = ("INVALID_ORDER", "RESOURCE_NOT_FOUND", "ORDER NOT FOUND", "UNKNOWN ORDER")
+ORDER_NOT_FOUND_STATUS_ERROR_TOKENS = ORDER_NOT_FOUND_ERROR_TOKENS + ("ORDER DOES NOT EXIST",)
+
+# Order batching: orders placed within the window are sent in one batch order request
+BATCH_ORDERS_ENABLED = False
+BATCH_ORDER_WINDOW_SECONDS = 0.02
+BATCH_ORDER_MAX_SIZE = 20
+
+# REST connection pool parameters
+REST_CONNECTION_LIMIT = 100
+REST_KEEPALIVE_TIMEOUT = 75  # Seconds an idle keep-alive connection is kept open
+REST_DNS_CACHE_TTL = 300     # Seconds resolved hostnames are cached
+
 # WebSocket parameters
 WS_HEARTBEAT_INTERVAL = 30  # Send ping every 30 seconds
 WS_HEARTBEAT_TIMEOUT = 60   # Timeout if no pong received in 60 seconds
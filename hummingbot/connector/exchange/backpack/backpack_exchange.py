@@ -1,8 +1,14 @@
 import asyncio
-import json
+import logging
+import random
+import re
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+import aiohttp
+from bidict import bidict
 
 from hummingbot.connector.exchange.backpack import (
     backpack_constants as CONSTANTS,
@@ -16,21 +22,96 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+_DECIMAL_ZERO = Decimal("0")
+# Defaults used when a market omits a filter value
+_DEFAULT_MIN_INCREMENT = Decimal("0.00000001")
+_DEFAULT_MAX_ORDER_SIZE = Decimal("999999999")
+# Backpack client order IDs are uint32
+_MAX_CLIENT_ID = 4294967295
+# Exchange order status -> OrderState lookup, bound once so order updates skip the module attribute lookups
+_order_state_of = CONSTANTS.ORDER_STATE_MAP.get
+# Shared stand-in for missing filter sections; only ever read from
+_EMPTY_FILTERS: Dict[str, Any] = {}
+# Minimum seconds between repeated "not ready" warnings while the status does not change
+_NOT_READY_LOG_INTERVAL = 5.0
+# Minimum seconds between full tracebacks for the same recurring polling error
+_TRACEBACK_LOG_INTERVAL = 60.0
+# Mock balances (total and available) reported in demo mode
+_DEMO_BALANCES: Dict[str, Decimal] = {
+    "USDC": Decimal("10000"),
+    "SOL": Decimal("10"),
+}
+_HTTP_STATUS_RE = re.compile(r"HTTP status is (\d{3})")
+# Case-insensitive error matchers, so predicates don't build an upper/lower-cased copy of the message
+_TIME_SYNC_ERROR_RE = re.compile(r"timestamp|window", re.IGNORECASE)
+_ORDER_NOT_FOUND_ERROR_RE = re.compile(
+    "|".join(map(re.escape, CONSTANTS.ORDER_NOT_FOUND_ERROR_TOKENS)), re.IGNORECASE)
+_ORDER_NOT_FOUND_STATUS_ERROR_RE = re.compile(
+    "|".join(map(re.escape, CONSTANTS.ORDER_NOT_FOUND_STATUS_ERROR_TOKENS)), re.IGNORECASE)
+
+
+def _to_decimal(value: Any, default: Decimal = _DECIMAL_ZERO) -> Decimal:
+    """
+    Convert a raw JSON value into a Decimal without the extra str() round-trip
+
+    :param value: Value as received from the exchange (str, int, float, Decimal or None)
+    :param default: Value returned when the field is missing or empty
+    :return: Decimal representation of the value
+    """
+    if value is None or value == "":
+        return default
+    if value == "0":
+        return _DECIMAL_ZERO
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=256)
+def _filter_decimal(value: Any, default: Decimal) -> Decimal:
+    """
+    Convert a market filter value into a Decimal, caching the result
+
+    Markets share a small set of distinct tick, step and size values, so each is parsed once
+    instead of once per market on every trading rules update.
+    """
+    return _to_decimal(value, default)
+
+
+def _market_fingerprint(market: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Return the market fields a trading rule is built from, to detect markets unchanged since the last update
+    """
+    filters = market.get("filters") or _EMPTY_FILTERS
+    price_filter = filters.get("price") or _EMPTY_FILTERS
+    quantity_filter = filters.get("quantity") or _EMPTY_FILTERS
+    return (
+        market.get("symbol"),
+        market.get("marketType"),
+        market.get("orderBookState"),
+        price_filter.get("tickSize"),
+        quantity_filter.get("minQuantity"),
+        quantity_filter.get("maxQuantity"),
+        quantity_filter.get("stepSize"),
+    )
+
 
 class BackpackExchange(ExchangePyBase):
     """
@@ -41,6 +122,18 @@ class BackpackExchange(ExchangePyBase):
     """
     
     web_utils = web_utils
+    
+    # Constant connector settings are plain class attributes instead of properties,
+    # so hot paths (throttler, order tracker) read them without a function call
+    name = CONSTANTS.EXCHANGE_NAME
+    rate_limits_rules = CONSTANTS.RATE_LIMITS
+    # Backpack uses uint32 for client order ID, so keep numeric IDs short
+    client_order_id_max_length = 10
+    client_order_id_prefix = ""  # No prefix needed for Backpack
+    trading_rules_request_path = CONSTANTS.MARKETS_PATH_URL
+    trading_pairs_request_path = CONSTANTS.MARKETS_PATH_URL
+    check_network_request_path = CONSTANTS.MARKETS_PATH_URL
+    is_cancel_request_in_exchange_synchronous = False
 
     def __init__(
         self,
@@ -64,6 +157,50 @@ class BackpackExchange(ExchangePyBase):
         else:
             self._trading_required = bool(api_key and api_secret)
         self._demo_mode = demo_mode or (not api_key and not api_secret)
+        # Built once here so the authenticator property is a plain attribute read
+        self._auth: Optional[BackpackAuth] = (
+            BackpackAuth(api_key=api_key, api_secret=api_secret) if api_key and api_secret else None
+        )
+        # User stream event type -> handler, built once instead of comparing event types per message
+        self._user_stream_event_handlers = {
+            "orderAccepted": self._process_ws_order_update,
+            "orderCancelled": self._process_ws_order_update,
+            "orderExpired": self._process_ws_order_update,
+            "orderFill": self._process_ws_order_update,
+            "orderModified": self._process_ws_order_update,
+        }
+        # Last raw capital API entry per asset with its parsed (total, available) balances
+        self._raw_balance_cache: Dict[str, Tuple[Tuple[Any, Any, Any], Decimal, Decimal]] = {}
+        # (trading pair, trade type, order type) -> symbol/side/orderType fields of the order request
+        self._order_request_templates: Dict[Tuple[str, TradeType, OrderType], Dict[str, str]] = {}
+        # Trading pair -> exchange symbol used in order, cancel and fill requests
+        self._exchange_symbols: Dict[str, str] = {}
+        # Time until which requests hold off after the exchange answered with a rate limit error
+        self._rate_limited_until = 0.0
+        # Rate limit errors received since the last successful request, to widen the backoff window during storms
+        self._successive_rate_limit_errors = 0
+        # Last logged not-ready status, to throttle the warnings emitted by the ready property
+        self._last_not_ready_status: Optional[Tuple[bool, ...]] = None
+        self._last_not_ready_log_time = 0.0
+        # Error site -> last time its traceback was logged
+        self._last_traceback_log_times: Dict[str, float] = {}
+        # Order requests waiting to be sent together in a single batch request
+        self._batch_orders_enabled = CONSTANTS.BATCH_ORDERS_ENABLED
+        self._pending_order_requests: List[Tuple[asyncio.Future, Dict[str, Any]]] = []
+        # (path, is auth required) -> fully-qualified REST URL, so requests skip rebuilding the URL
+        self._rest_url_cache: Dict[Tuple[str, bool], str] = {}
+        # REST assistant shared by all requests, created on first use
+        self._rest_assistant: Optional[RESTAssistant] = None
+        # Last markets response and when it was fetched, shared by the trading rules and symbol map requests
+        self._markets_cache: Optional[Any] = None
+        self._markets_cache_timestamp = 0.0
+        self._markets_lock = asyncio.Lock()
+        # Market fingerprint -> trading rule built from it, so unchanged markets reuse their rule on refresh
+        self._trading_rules_by_fingerprint: Dict[Tuple[Any, ...], TradingRule] = {}
+        # Exchange order ID -> tracked order, so user stream events resolve their order without scanning
+        self._exchange_id_index: Dict[str, InFlightOrder] = {}
+        # Bounds the order status and fill queries a status update issues concurrently
+        self._order_status_semaphore = asyncio.Semaphore(CONSTANTS.ORDER_STATUS_MAX_CONCURRENT_REQUESTS)
         
         # Debug logging
         self.logger().info(f"BackpackExchange initialized, "
@@ -79,67 +216,18 @@ class BackpackExchange(ExchangePyBase):
         """
         Return the authenticator for the exchange
         """
-        if not hasattr(self, "_auth"):
-            self._auth = None
-        
-        if self._auth is None and self._api_key and self._api_secret:
-            self._auth = BackpackAuth(
-                api_key=self._api_key,
-                api_secret=self._api_secret
-            )
         return self._auth
 
-    @property
-    def name(self) -> str:
-        """Exchange name"""
-        return CONSTANTS.EXCHANGE_NAME
-
-    @property
-    def rate_limits_rules(self) -> List[RateLimit]:
-        """Rate limit rules"""
-        return CONSTANTS.RATE_LIMITS
-
     @property
     def domain(self) -> str:
         """Exchange domain"""
         return self._domain
 
-    @property
-    def client_order_id_max_length(self) -> int:
-        """Maximum length of client order id"""
-        # Backpack uses uint32 for client order ID
-        return 10  # Reasonable length for numeric ID as string
-
-    @property
-    def client_order_id_prefix(self) -> str:
-        """Prefix for client order id"""
-        return ""  # No prefix needed for Backpack
-
-    @property
-    def trading_rules_request_path(self) -> str:
-        """API path for trading rules"""
-        return CONSTANTS.MARKETS_PATH_URL
-
-    @property
-    def trading_pairs_request_path(self) -> str:
-        """API path for trading pairs"""
-        return CONSTANTS.MARKETS_PATH_URL
-
-    @property
-    def check_network_request_path(self) -> str:
-        """API path for network check"""
-        return CONSTANTS.MARKETS_PATH_URL
-
     @property
     def trading_pairs(self) -> List[str]:
         """List of trading pairs"""
         return self._trading_pairs
 
-    @property
-    def is_cancel_request_in_exchange_synchronous(self) -> bool:
-        """Whether cancel requests are synchronous"""
-        return False
-
     @property
     def is_trading_required(self) -> bool:
         """Whether trading is required"""
@@ -151,15 +239,24 @@ class BackpackExchange(ExchangePyBase):
         Override to add debug logging
         """
         status = self.status_dict
-        is_ready = all(status.values())
+        status_values = tuple(status.values())
+        is_ready = all(status_values)
         
+        # Only log when the failed checks change, or at most once per interval while they stay the same
         if not is_ready:
-            not_ready_items = [k for k, v in status.items() if not v]
-            # Use warning level so it shows up even with INFO log level
-            self.logger().warning(f"BackpackExchange not ready. Failed checks: {not_ready_items}, Full status: {status}")
-            self.logger().warning(f"Additional debug info: is_trading_required={self.is_trading_required}, "
-                                f"symbol_map_ready={self.trading_pair_symbol_map_ready()}, "
-                                f"order_book_ready={self.order_book_tracker.ready if self.order_book_tracker else 'None'}")
+            now = time.monotonic()
+            if (status_values != self._last_not_ready_status
+                    or now - self._last_not_ready_log_time >= _NOT_READY_LOG_INTERVAL):
+                self._last_not_ready_status = status_values
+                self._last_not_ready_log_time = now
+                not_ready_items = [k for k, v in status.items() if not v]
+                # Use warning level so it shows up even with INFO log level
+                self.logger().warning(f"BackpackExchange not ready. Failed checks: {not_ready_items}, Full status: {status}")
+                self.logger().warning(f"Additional debug info: is_trading_required={self.is_trading_required}, "
+                                    f"symbol_map_ready={self.trading_pair_symbol_map_ready()}, "
+                                    f"order_book_ready={self.order_book_tracker.ready if self.order_book_tracker else 'None'}")
+        else:
+            self._last_not_ready_status = None
         
         return is_ready
 
@@ -170,8 +267,7 @@ class BackpackExchange(ExchangePyBase):
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
         """Check if exception is related to time synchronization"""
         # Implement based on Backpack's specific error messages
-        error_message = str(request_exception).lower()
-        return "timestamp" in error_message or "window" in error_message
+        return _TIME_SYNC_ERROR_RE.search(str(request_exception)) is not None
 
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         """Create web assistants factory"""
@@ -194,7 +290,7 @@ class BackpackExchange(ExchangePyBase):
         # Only create user stream if we have API credentials
         if self._api_key and self._api_secret:
             return BackpackAPIUserStreamDataSource(
-                auth=self.authenticator,
+                auth=self._auth,
                 trading_pairs=self._trading_pairs,
                 connector=self,
                 api_factory=self._web_assistants_factory,
@@ -245,13 +341,8 @@ class BackpackExchange(ExchangePyBase):
         # Only start trading-related tasks if trading is required
         if self.is_trading_required:
             self.logger().info("Starting trading-related tasks...")
-            # Initialize trading rules immediately before starting polling loop
-            try:
-                await self._update_trading_rules()
-                self.logger().info(f"Trading rules initialized with {len(self._trading_rules)} rules")
-            except Exception as e:
-                self.logger().error(f"Failed to initialize trading rules: {e}", exc_info=True)
-                
+            # Trading rules are loaded by the first iteration of the polling loop; the connector
+            # reports not ready (trading_rule_initialized) until they arrive
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
             self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
@@ -259,7 +350,7 @@ class BackpackExchange(ExchangePyBase):
             
             # Skip user stream tracker for public-only implementation
             if self._user_stream_tracker is not None:
-                self._user_stream_tracker_task = safe_ensure_future(self._user_stream_tracker.start())
+                self._user_stream_tracker_task = self._create_user_stream_tracker_task()
                 self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
     
@@ -267,7 +358,8 @@ class BackpackExchange(ExchangePyBase):
         """
         Update account balances from the exchange
         """
-        self.logger().debug(f"_update_balances called, is_trading_required={self.is_trading_required}, demo_mode={self._demo_mode}")
+        self.logger().debug("_update_balances called, is_trading_required=%s, demo_mode=%s",
+                            self.is_trading_required, self._demo_mode)
         
         if not self.is_trading_required:
             # Set empty balances for public-only mode
@@ -275,127 +367,180 @@ class BackpackExchange(ExchangePyBase):
             self._account_available_balances = {}
             return
         
-        # In demo mode, provide mock balances
+        # In demo mode, provide mock balances (only written when they are not already in place)
         if self._demo_mode:
-            self.logger().info("Demo mode: Using mock balances")
-            self._account_balances = {
-                "USDC": Decimal("10000"),
-                "SOL": Decimal("10"),
-            }
-            self._account_available_balances = {
-                "USDC": Decimal("10000"),
-                "SOL": Decimal("10"),
-            }
+            if self._account_balances != _DEMO_BALANCES or self._account_available_balances != _DEMO_BALANCES:
+                self.logger().info("Demo mode: Using mock balances")
+                self._apply_balance_snapshot(_DEMO_BALANCES, _DEMO_BALANCES)
             return
         
-        # Fetch balances from the exchange
+        # Fetch spot (capital API) and collateral balances concurrently. The collateral response is
+        # merged into the spot balances, or used on its own if the capital API request fails
+        self.logger().debug("Fetching balances from %s and %s", CONSTANTS.BALANCES_PATH_URL, CONSTANTS.COLLATERAL_PATH_URL)
+        response, collateral_response = await safe_gather(
+            self._api_get(path_url=CONSTANTS.BALANCES_PATH_URL, is_auth_required=True),
+            self._api_get(path_url=CONSTANTS.COLLATERAL_PATH_URL, is_auth_required=True),
+            return_exceptions=True
+        )
+        for result in (response, collateral_response):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+        
         try:
-            # First try the capital API for spot balances
-            self.logger().debug(f"Fetching balances from {CONSTANTS.BALANCES_PATH_URL}")
-            response = await self._api_get(
-                path_url=CONSTANTS.BALANCES_PATH_URL,
-                is_auth_required=True
-            )
-            
-            self.logger().info(f"Capital API response: {response}")
+            if isinstance(response, Exception):
+                raise response
             
-            # Clear existing balances
-            self._account_balances.clear()
-            self._account_available_balances.clear()
+            self.logger().debug("Capital API response: %s", response)
             
-            # Check if we got any non-zero balances from capital API
-            has_spot_balance = False
+            # Collect the snapshot locally, then apply only what changed to the balance dicts
+            new_balances: Dict[str, Decimal] = {}
+            new_available_balances: Dict[str, Decimal] = {}
+            new_raw_balance_cache: Dict[str, Tuple[Tuple[Any, Any, Any], Decimal, Decimal]] = {}
             
             # Parse balance data
             # According to API docs, response format is: {"BTC": {"available": "0.1", "locked": "0", "staked": "0"}}
             if isinstance(response, dict):
+                raw_balance_cache = self._raw_balance_cache
                 for asset, balance_data in response.items():
-                    if not isinstance(balance_data, dict):
-                        self.logger().warning(f"Unexpected balance format for {asset}: {balance_data}")
+                    try:
+                        raw_balance = (balance_data.get("available"), balance_data.get("locked"), balance_data.get("staked"))
+                    except AttributeError:
+                        self.logger().warning("Unexpected balance format for %s: %s", asset, balance_data)
                         continue
                     
-                    # Parse balance fields
-                    available = Decimal(str(balance_data.get("available", "0")))
-                    locked = Decimal(str(balance_data.get("locked", "0")))
-                    staked = Decimal(str(balance_data.get("staked", "0")))
-                    
-                    # Total balance is sum of available, locked, and staked
-                    total = available + locked + staked
-                    
-                    if total > 0:
-                        has_spot_balance = True
-                    
-                    self._account_balances[asset] = total
-                    self._account_available_balances[asset] = available
+                    # Only parse balance fields that changed since the last snapshot
+                    cached_balance = raw_balance_cache.get(asset)
+                    if cached_balance is not None and cached_balance[0] == raw_balance:
+                        _, total, available = cached_balance
+                    else:
+                        available = _to_decimal(raw_balance[0])
+                        locked = _to_decimal(raw_balance[1])
+                        staked = _to_decimal(raw_balance[2])
+                        
+                        # Total balance is sum of available, locked, and staked (usually zero, so skip those adds)
+                        total = available
+                        if locked:
+                            total += locked
+                        if staked:
+                            total += staked
+                    new_raw_balance_cache[asset] = (raw_balance, total, available)
+                    new_balances[asset] = total
+                    new_available_balances[asset] = available
             
-            # Log spot balances first
-            if has_spot_balance:
-                self.logger().info(f"Updated balances from capital API: {len(self._account_balances)} assets")
-                for asset, total in self._account_balances.items():
-                    available = self._account_available_balances.get(asset, Decimal("0"))
-                    self.logger().info(f"  {asset}: total={total}, available={available}")
+            self._apply_balance_snapshot(new_balances, new_available_balances)
+            self._raw_balance_cache = new_raw_balance_cache
+            
+            # Log spot balances first, if the capital API reported any non-zero balance
+            if self.logger().isEnabledFor(logging.INFO) and any(total > 0 for total in new_balances.values()):
+                self.logger().info("Updated balances from capital API: %s assets", len(self._account_balances))
+                self._log_balances()
             
             # Always check collateral API to get complete balance picture
             # This ensures we don't miss funds in margin/futures account
             self.logger().info("Checking collateral API for additional balances...")
             try:
-                await self._update_balances_from_collateral_merge()
+                self._update_balances_from_collateral_merge(collateral_response)
             except Exception as e:
-                self.logger().debug(f"Could not fetch collateral balances: {str(e)}")
+                self.logger().debug("Could not fetch collateral balances: %s", e)
                 # Continue with spot balances only if collateral fetch fails
                     
         except Exception as e:
-            self.logger().error(
-                f"Error updating balances. Error: {str(e)}",
-                exc_info=True
-            )
+            self._log_error_with_sampled_traceback("update_balances", "Error updating balances.", e)
             # Try collateral API as fallback
             try:
-                self.logger().info("Attempting to fetch balances from collateral API as fallback...")
-                await self._update_balances_from_collateral()
+                self.logger().info("Attempting to use balances from collateral API as fallback...")
+                self._update_balances_from_collateral(collateral_response)
             except Exception as collateral_error:
-                self.logger().error(
-                    f"Error fetching from collateral API: {str(collateral_error)}",
-                    exc_info=True
+                self._log_error_with_sampled_traceback(
+                    "collateral_fallback", "Error fetching from collateral API.", collateral_error
                 )
                 # Don't raise - let the connector continue with empty balances
                 # This prevents the connector from getting stuck if balance API fails
 
-    async def _update_balances_from_collateral_merge(self) -> None:
+    def _log_error_with_sampled_traceback(self, key: str, message: str, exception: Exception) -> None:
+        """
+        Log an error from a polling path, attaching the traceback at most once per interval for each key
+        
+        A persistent failure (e.g. a misconfiguration) hits the same error on every poll, so repeated
+        occurrences are logged without formatting the full stack again.
+        
+        :param key: Identifies the error site for sampling
+        :param message: Error description
+        :param exception: The exception being handled
+        """
+        now = time.monotonic()
+        last_traceback_time = self._last_traceback_log_times.get(key)
+        if last_traceback_time is None or now - last_traceback_time >= _TRACEBACK_LOG_INTERVAL:
+            self._last_traceback_log_times[key] = now
+            self.logger().error(f"{message} Error: {exception}", exc_info=exception)
+        else:
+            self.logger().error(f"{message} Error: {exception}")
+
+    def _log_balances(self) -> None:
+        """
+        Log the total and available balance of every asset at info level
+        """
+        logger = self.logger()
+        available_balances = self._account_available_balances
+        for asset, total in self._account_balances.items():
+            logger.info("  %s: total=%s, available=%s", asset, total, available_balances.get(asset, _DECIMAL_ZERO))
+
+    def _apply_balance_snapshot(self,
+                                new_balances: Dict[str, Decimal],
+                                new_available_balances: Dict[str, Decimal]) -> None:
+        """
+        Update the balance dicts in place to match a balance snapshot
+        
+        Only changed entries are written and assets missing from the snapshot are removed, so the dicts
+        never go through an empty state and keep their identity for anyone holding a reference.
+        
+        :param new_balances: Total balance per asset
+        :param new_available_balances: Available balance per asset
+        """
+        for balances, snapshot in ((self._account_balances, new_balances),
+                                   (self._account_available_balances, new_available_balances)):
+            for asset in balances.keys() - snapshot.keys():
+                del balances[asset]
+            for asset, balance in snapshot.items():
+                if balances.get(asset) != balance:
+                    balances[asset] = balance
+
+    def _update_balances_from_collateral_merge(self, response: Any) -> None:
         """
         Update account balances from the collateral API and merge with existing spot balances
         This ensures we capture funds from both spot and margin/futures accounts
+        
+        :param response: Collateral API response, or the exception raised while requesting it
         """
         try:
-            self.logger().debug(f"Fetching collateral from {CONSTANTS.COLLATERAL_PATH_URL}")
-            response = await self._api_get(
-                path_url=CONSTANTS.COLLATERAL_PATH_URL,
-                is_auth_required=True
-            )
+            if isinstance(response, Exception):
+                raise response
             
-            self.logger().debug(f"Collateral API response: {response}")
+            self.logger().debug("Collateral API response: %s", response)
             
             if isinstance(response, dict):
                 # Extract balances from collateral response
-                net_equity_available = Decimal(str(response.get("netEquityAvailable", "0")))
-                net_equity = Decimal(str(response.get("netEquity", "0")))
+                net_equity_available = _to_decimal(response.get("netEquityAvailable"))
+                net_equity = _to_decimal(response.get("netEquity"))
                 
                 # Check if there's a collateral breakdown by asset
                 collateral_data = response.get("collateral")
                 
                 if isinstance(collateral_data, list):
+                    account_balances = self._account_balances
+                    account_available_balances = self._account_available_balances
                     # New format - list of collateral assets
                     for collateral_item in collateral_data:
                         if isinstance(collateral_item, dict):
                             symbol = collateral_item.get("symbol")
                             if symbol:
                                 # Get available quantity from collateral
-                                available_quantity = Decimal(str(collateral_item.get("availableQuantity", "0")))
-                                total_quantity = Decimal(str(collateral_item.get("totalQuantity", "0")))
+                                available_quantity = _to_decimal(collateral_item.get("availableQuantity"))
+                                total_quantity = _to_decimal(collateral_item.get("totalQuantity"))
                                 
                                 # Merge with existing balances - use the maximum available
-                                existing_total = self._account_balances.get(symbol, Decimal("0"))
-                                existing_available = self._account_available_balances.get(symbol, Decimal("0"))
+                                existing_total = account_balances.get(symbol, _DECIMAL_ZERO)
+                                existing_available = account_available_balances.get(symbol, _DECIMAL_ZERO)
                                 
                                 # For available balance, use net equity available if it's higher than spot
                                 # This handles the case where collateral shows 0 available but net equity is available
@@ -407,19 +552,21 @@ class BackpackExchange(ExchangePyBase):
                                 final_total = max(existing_total, total_quantity)
                                 final_available = max(existing_available, available_quantity)
                                 
-                                self._account_balances[symbol] = final_total
-                                self._account_available_balances[symbol] = final_available
+                                account_balances[symbol] = final_total
+                                account_available_balances[symbol] = final_available
                                 
                                 if final_total > existing_total or final_available > existing_available:
-                                    self.logger().info(f"Updated {symbol} from collateral - "
-                                                     f"Spot: total={existing_total}, available={existing_available} | "
-                                                     f"Collateral: total={total_quantity}, available={available_quantity} | "
-                                                     f"Final: total={final_total}, available={final_available}")
+                                    self.logger().info("Updated %s from collateral - "
+                                                       "Spot: total=%s, available=%s | "
+                                                       "Collateral: total=%s, available=%s | "
+                                                       "Final: total=%s, available=%s",
+                                                       symbol, existing_total, existing_available,
+                                                       total_quantity, available_quantity, final_total, final_available)
                 else:
                     # If no detailed breakdown but we have net equity, use it for USDC
                     if net_equity > 0:
-                        existing_total = self._account_balances.get("USDC", Decimal("0"))
-                        existing_available = self._account_available_balances.get("USDC", Decimal("0"))
+                        existing_total = self._account_balances.get("USDC", _DECIMAL_ZERO)
+                        existing_available = self._account_available_balances.get("USDC", _DECIMAL_ZERO)
                         
                         # Use maximum values
                         final_total = max(existing_total, net_equity)
@@ -428,41 +575,40 @@ class BackpackExchange(ExchangePyBase):
                         if final_total > existing_total or final_available > existing_available:
                             self._account_balances["USDC"] = final_total
                             self._account_available_balances["USDC"] = final_available
-                            self.logger().info(f"Updated USDC from collateral net equity - "
-                                             f"Final: total={final_total}, available={final_available}")
+                            self.logger().info("Updated USDC from collateral net equity - Final: total=%s, available=%s",
+                                               final_total, final_available)
                 
                 # Log final merged balances
-                self.logger().info(f"Final merged balances: {len(self._account_balances)} assets")
-                for asset, total in self._account_balances.items():
-                    available = self._account_available_balances.get(asset, Decimal("0"))
-                    self.logger().info(f"  {asset}: total={total}, available={available}")
-                
-                # Log collateral summary
-                self.logger().info(f"Collateral account summary: netEquity={net_equity}, netEquityAvailable={net_equity_available}")
+                if self.logger().isEnabledFor(logging.INFO):
+                    self.logger().info("Final merged balances: %s assets", len(self._account_balances))
+                    self._log_balances()
+                    
+                    # Log collateral summary
+                    self.logger().info("Collateral account summary: netEquity=%s, netEquityAvailable=%s",
+                                       net_equity, net_equity_available)
             else:
-                self.logger().warning(f"Unexpected collateral response format: {type(response)}")
+                self.logger().warning("Unexpected collateral response format: %s", type(response))
                 
         except Exception as e:
-            self.logger().debug(f"Could not fetch collateral balances: {str(e)}")
+            self.logger().debug("Could not fetch collateral balances: %s", e)
             # Don't raise - continue with existing balances
 
-    async def _update_balances_from_collateral(self) -> None:
+    def _update_balances_from_collateral(self, response: Any) -> None:
         """
         Update account balances from the collateral API
         This is used when the capital API returns no balances (funds are in margin/futures account)
+        
+        :param response: Collateral API response, or the exception raised while requesting it
         """
         try:
-            self.logger().debug(f"Fetching collateral from {CONSTANTS.COLLATERAL_PATH_URL}")
-            response = await self._api_get(
-                path_url=CONSTANTS.COLLATERAL_PATH_URL,
-                is_auth_required=True
-            )
+            if isinstance(response, Exception):
+                raise response
             
-            self.logger().info(f"Collateral API response: {response}")
+            self.logger().info("Collateral API response: %s", response)
             
-            # Clear existing balances
-            self._account_balances.clear()
-            self._account_available_balances.clear()
+            # Collect the snapshot locally, then apply only what changed to the balance dicts
+            new_balances: Dict[str, Decimal] = {}
+            new_available_balances: Dict[str, Decimal] = {}
             
             if isinstance(response, dict):
                 # Extract balances from collateral response
@@ -471,8 +617,8 @@ class BackpackExchange(ExchangePyBase):
                 # - netEquity: Total equity
                 # - collateral: Collateral breakdown by asset
                 
-                net_equity_available = Decimal(str(response.get("netEquityAvailable", "0")))
-                net_equity = Decimal(str(response.get("netEquity", "0")))
+                net_equity_available = _to_decimal(response.get("netEquityAvailable"))
+                net_equity = _to_decimal(response.get("netEquity"))
                 
                 # Check if there's a collateral breakdown by asset
                 collateral_data = response.get("collateral")
@@ -483,57 +629,58 @@ class BackpackExchange(ExchangePyBase):
                             symbol = collateral_item.get("symbol", "")
                             if symbol:
                                 # Use totalQuantity as the balance
-                                total_quantity = Decimal(str(collateral_item.get("totalQuantity", "0")))
-                                available_quantity = Decimal(str(collateral_item.get("availableQuantity", "0")))
+                                total_quantity = _to_decimal(collateral_item.get("totalQuantity"))
+                                available_quantity = _to_decimal(collateral_item.get("availableQuantity"))
                                 
                                 # If availableQuantity is 0, use a portion of netEquityAvailable
                                 # This handles the case where funds are in margin account
                                 if available_quantity == 0 and symbol == "USDC":
                                     # Use the netEquityAvailable for USDC
-                                    self._account_balances[symbol] = net_equity
-                                    self._account_available_balances[symbol] = net_equity_available
+                                    new_balances[symbol] = net_equity
+                                    new_available_balances[symbol] = net_equity_available
                                 else:
-                                    self._account_balances[symbol] = total_quantity
-                                    self._account_available_balances[symbol] = available_quantity
+                                    new_balances[symbol] = total_quantity
+                                    new_available_balances[symbol] = available_quantity
                                     
-                                self.logger().debug(f"Parsed {symbol} from collateral: total={total_quantity}, available={available_quantity}")
+                                self.logger().debug("Parsed %s from collateral: total=%s, available=%s",
+                                                    symbol, total_quantity, available_quantity)
                 elif isinstance(collateral_data, dict):
                     # Old format - dict mapping
                     for asset, collateral_info in collateral_data.items():
                         if isinstance(collateral_info, dict):
                             # Extract value from collateral info
-                            value = Decimal(str(collateral_info.get("value", "0")))
+                            value = _to_decimal(collateral_info.get("value"))
                             # For collateral accounts, available balance might be the collateral value
-                            self._account_balances[asset] = value
-                            self._account_available_balances[asset] = value
+                            new_balances[asset] = value
+                            new_available_balances[asset] = value
                         elif isinstance(collateral_info, (str, int, float)):
                             # If collateral_info is just a value
-                            value = Decimal(str(collateral_info))
-                            self._account_balances[asset] = value
-                            self._account_available_balances[asset] = value
+                            value = _to_decimal(collateral_info)
+                            new_balances[asset] = value
+                            new_available_balances[asset] = value
                 else:
                     # If no detailed collateral breakdown, use net equity as USDC balance
                     # This is a reasonable assumption as USDC is often the quote currency
                     if net_equity > 0:
-                        self.logger().info(f"No detailed collateral breakdown found, using net equity as USDC balance")
-                        self._account_balances["USDC"] = net_equity
-                        self._account_available_balances["USDC"] = net_equity_available
+                        self.logger().info("No detailed collateral breakdown found, using net equity as USDC balance")
+                        new_balances["USDC"] = net_equity
+                        new_available_balances["USDC"] = net_equity_available
                 
-                self.logger().info(f"Updated balances from collateral API: {len(self._account_balances)} assets")
-                for asset, total in self._account_balances.items():
-                    available = self._account_available_balances.get(asset, Decimal("0"))
-                    self.logger().info(f"  {asset}: total={total}, available={available}")
+                self._apply_balance_snapshot(new_balances, new_available_balances)
                 
-                # Log additional collateral info for debugging
-                self.logger().info(f"Collateral account summary: netEquity={net_equity}, netEquityAvailable={net_equity_available}")
+                if self.logger().isEnabledFor(logging.INFO):
+                    self.logger().info("Updated balances from collateral API: %s assets", len(self._account_balances))
+                    self._log_balances()
+                    
+                    # Log additional collateral info for debugging
+                    self.logger().info("Collateral account summary: netEquity=%s, netEquityAvailable=%s",
+                                       net_equity, net_equity_available)
             else:
-                self.logger().warning(f"Unexpected collateral response format: {type(response)}")
+                self._apply_balance_snapshot(new_balances, new_available_balances)
+                self.logger().warning("Unexpected collateral response format: %s", type(response))
                 
         except Exception as e:
-            self.logger().error(
-                f"Error fetching collateral balances. Error: {str(e)}",
-                exc_info=True
-            )
+            self._log_error_with_sampled_traceback("collateral_balances", "Error fetching collateral balances.", e)
             raise
 
     def _get_fee(self,
@@ -553,90 +700,138 @@ class BackpackExchange(ExchangePyBase):
     async def _update_trading_rules(self) -> None:
         """Update trading rules from the exchange"""
         try:
-            self.logger().debug(f"Fetching markets from {self.trading_rules_request_path}")
-            markets = await self._api_get(
-                path_url=self.trading_rules_request_path,
-                is_auth_required=False
-            )
+            markets = await self._make_trading_rules_request()
             
-            self.logger().debug(f"Markets response type: {type(markets)}, length: {len(markets) if isinstance(markets, list) else 'N/A'}")
+            self.logger().debug("Markets response type: %s, length: %s",
+                                type(markets), len(markets) if isinstance(markets, list) else "N/A")
             
-            trading_rules_list = []
+            trading_rules: Dict[str, TradingRule] = {}
             if isinstance(markets, list):
+                debug_enabled = self.logger().isEnabledFor(logging.DEBUG)
+                previous_rules = self._trading_rules_by_fingerprint
+                rules_by_fingerprint: Dict[Tuple[Any, ...], TradingRule] = {}
                 for market in markets:
-                    try:
-                        # Skip perpetual markets - only handle spot markets
-                        # This is correct because perpetual markets are handled by the separate
-                        # backpack_perpetual connector in /connector/derivative/backpack_perpetual/
-                        market_type = market.get("marketType", "")
-                        if market_type == "PERP":
-                            self.logger().debug(f"Skipping perpetual market {market.get('symbol')}")
-                            continue
-                        
-                        # According to API docs, check orderBookState instead of status
-                        order_book_state = market.get("orderBookState")
-                        if order_book_state and order_book_state not in CONSTANTS.ACTIVE_ORDER_BOOK_STATES:
-                            self.logger().debug(f"Skipping market {market.get('symbol')} with state: {order_book_state}")
+                    fingerprint = _market_fingerprint(market)
+                    trading_rule = previous_rules.get(fingerprint)
+                    if trading_rule is None:
+                        try:
+                            trading_rule = self._trading_rule_from_market(market)
+                        except Exception as e:
+                            self._log_error_with_sampled_traceback(
+                                "parse_trading_rule", f"Error parsing trading rule for market: {market}.", e
+                            )
                             continue
-                            
-                        exchange_symbol = market.get("symbol", "")
-                        if not exchange_symbol:
-                            self.logger().warning(f"Market missing symbol: {market}")
+                        if trading_rule is None:
                             continue
-                            
-                        trading_pair = utils.convert_from_exchange_trading_pair(exchange_symbol)
-                        
-                        filters = market.get("filters", {})
-                        price_filter = filters.get("price", {})
-                        quantity_filter = filters.get("quantity", {})
-                        
-                        # Parse filter values with proper defaults
-                        min_price = Decimal(str(price_filter.get("minPrice", "0.00000001")))
-                        max_price = price_filter.get("maxPrice")
-                        tick_size = Decimal(str(price_filter.get("tickSize", "0.00000001")))
-                        
-                        min_quantity = Decimal(str(quantity_filter.get("minQuantity", "0.00000001")))
-                        max_quantity = quantity_filter.get("maxQuantity")
-                        step_size = Decimal(str(quantity_filter.get("stepSize", "0.00000001")))
-                        
-                        trading_rule = TradingRule(
-                            trading_pair=trading_pair,
-                            min_order_size=min_quantity,
-                            max_order_size=Decimal(str(max_quantity)) if max_quantity else Decimal("999999999"),
-                            min_price_increment=tick_size,
-                            min_base_amount_increment=step_size,
-                            min_quote_amount_increment=tick_size,
-                            min_notional_size=Decimal("0"),  # Not provided by Backpack
-                            min_order_value=Decimal("0"),  # Not provided by Backpack
-                            supports_limit_orders=True,
-                            supports_market_orders=True,
-                        )
-                        
-                        trading_rules_list.append(trading_rule)
-                        self.logger().debug(f"Added trading rule for {trading_pair}: "
-                                          f"min_qty={min_quantity}, max_qty={max_quantity}, "
-                                          f"tick_size={tick_size}, step_size={step_size}")
-                        
-                    except Exception as e:
-                        self.logger().error(
-                            f"Error parsing trading rule for market: {market}. Error: {str(e)}",
-                            exc_info=True
-                        )
+                    
+                    rules_by_fingerprint[fingerprint] = trading_rule
+                    trading_rules[trading_rule.trading_pair] = trading_rule
+                    if debug_enabled:
+                        self.logger().debug(
+                            "Added trading rule for %s: min_qty=%s, max_qty=%s, tick_size=%s, step_size=%s",
+                            trading_rule.trading_pair, trading_rule.min_order_size, trading_rule.max_order_size,
+                            trading_rule.min_price_increment, trading_rule.min_base_amount_increment)
+                # Delisted markets drop out, since only the fingerprints of this response are kept
+                self._trading_rules_by_fingerprint = rules_by_fingerprint
+                # Refresh the symbol map from the same payload, as the base class does, instead of a separate fetch
+                self._initialize_trading_pair_symbols_from_exchange_info(markets)
             else:
-                self.logger().warning(f"Unexpected markets response format: {type(markets)}")
+                self.logger().warning("Unexpected markets response format: %s", type(markets))
                         
-            self._trading_rules.clear()
-            for trading_rule in trading_rules_list:
-                self._trading_rules[trading_rule.trading_pair] = trading_rule
+            # Swap in the new rules in one step instead of clearing and refilling the current dict
+            self._trading_rules = trading_rules
             
-            self.logger().info(f"Updated trading rules for {len(self._trading_rules)} markets")
+            self.logger().info("Updated trading rules for %s markets", len(self._trading_rules))
                 
         except Exception as e:
-            self.logger().error(
-                f"Error updating trading rules. Error: {str(e)}",
-                exc_info=True
-            )
+            self._log_error_with_sampled_traceback("update_trading_rules", "Error updating trading rules.", e)
+
+
+    def _trading_rule_from_market(self, market: Dict[str, Any]) -> Optional[TradingRule]:
+        """
+        Build the trading rule for a market of the markets response
+        
+        :param market: Market entry as returned by the exchange
+        :return: The trading rule, or None if the market is not traded by this connector
+        """
+        # Skip perpetual markets - only handle spot markets
+        # This is correct because perpetual markets are handled by the separate
+        # backpack_perpetual connector in /connector/derivative/backpack_perpetual/
+        if market.get("marketType") in CONSTANTS.SKIPPED_MARKET_TYPES:
+            return None
+        
+        # According to API docs, check orderBookState instead of status
+        order_book_state = market.get("orderBookState")
+        if order_book_state and order_book_state not in CONSTANTS.ACTIVE_ORDER_BOOK_STATES:
+            return None
+            
+        exchange_symbol = market.get("symbol", "")
+        if not exchange_symbol:
+            self.logger().warning("Market missing symbol: %s", market)
+            return None
+        
+        filters = market.get("filters") or _EMPTY_FILTERS
+        price_filter = filters.get("price") or _EMPTY_FILTERS
+        quantity_filter = filters.get("quantity") or _EMPTY_FILTERS
+        
+        # Parse filter values with proper defaults (price bounds are not part of TradingRule)
+        tick_size = _filter_decimal(price_filter.get("tickSize"), _DEFAULT_MIN_INCREMENT)
+        max_quantity = quantity_filter.get("maxQuantity")
+        
+        return TradingRule(
+            trading_pair=utils.convert_from_exchange_trading_pair(exchange_symbol),
+            min_order_size=_filter_decimal(quantity_filter.get("minQuantity"), _DEFAULT_MIN_INCREMENT),
+            max_order_size=_filter_decimal(max_quantity, _DECIMAL_ZERO) if max_quantity else _DEFAULT_MAX_ORDER_SIZE,
+            min_price_increment=tick_size,
+            min_base_amount_increment=_filter_decimal(quantity_filter.get("stepSize"), _DEFAULT_MIN_INCREMENT),
+            min_quote_amount_increment=tick_size,
+            min_notional_size=_DECIMAL_ZERO,  # Not provided by Backpack
+            min_order_value=_DECIMAL_ZERO,  # Not provided by Backpack
+            supports_limit_orders=True,
+            supports_market_orders=True,
+        )
+
+    def _exchange_symbol(self, trading_pair: str) -> str:
+        """Return the exchange symbol for a trading pair, converting it only the first time it is requested"""
+        symbol = self._exchange_symbols.get(trading_pair)
+        if symbol is None:
+            symbol = utils.convert_to_exchange_trading_pair(trading_pair)
+            self._exchange_symbols[trading_pair] = symbol
+        return symbol
+
+    @staticmethod
+    def _numeric_client_id(order_id: str) -> Optional[int]:
+        """
+        Return the numeric Backpack client ID for a client order ID, or None if it has no valid one
 
+        :param order_id: Client order ID, optionally with a "-" separated prefix
+        :return: The numeric part of the ID if it fits in a uint32
+        """
+        numeric_id = order_id[order_id.rfind("-") + 1:]
+        if not numeric_id.isdecimal():
+            return None
+        client_id = int(numeric_id)
+        return client_id if client_id <= _MAX_CLIENT_ID else None
+
+    def _order_request_template(self, trading_pair: str, trade_type: TradeType, order_type: OrderType) -> Dict[str, str]:
+        """
+        Return the order request fields that only depend on the trading pair, side and order type
+        
+        :param trading_pair: Trading pair
+        :param trade_type: Buy or Sell
+        :param order_type: Limit or Market
+        :return: Dictionary with the symbol, side and orderType fields
+        """
+        key = (trading_pair, trade_type, order_type)
+        template = self._order_request_templates.get(key)
+        if template is None:
+            template = {
+                "symbol": self._exchange_symbol(trading_pair),
+                "side": CONSTANTS.TRADE_TYPE_MAP[trade_type],
+                "orderType": CONSTANTS.ORDER_TYPE_MAP[order_type],
+            }
+            self._order_request_templates[key] = template
+        return template
 
     async def _place_order(self,
                           order_id: str,
@@ -667,55 +862,36 @@ class BackpackExchange(ExchangePyBase):
             return exchange_order_id, self._time_synchronizer.time()
             
         try:
-            # Convert trading pair to exchange format
-            exchange_symbol = utils.convert_to_exchange_trading_pair(trading_pair)
-            
-            # Build order request payload
+            # Build order request payload from the cached per pair/side/type fields
             order_data = {
-                "symbol": exchange_symbol,
-                "side": CONSTANTS.TRADE_TYPE_MAP[trade_type],
-                "orderType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-                "quantity": str(amount),
+                **self._order_request_template(trading_pair, trade_type, order_type),
+                # Fixed-point formatting, since str() renders small or rounded Decimals in exponent notation
+                "quantity": format(amount, "f"),
+                # Add optional parameters
+                "timeInForce": kwargs.get("time_in_force", CONSTANTS.DEFAULT_TIME_IN_FORCE),
             }
             
             # Add price for limit orders
             if order_type == OrderType.LIMIT:
-                order_data["price"] = str(price)
-            
-            # Add optional parameters
-            if "time_in_force" in kwargs:
-                order_data["timeInForce"] = kwargs["time_in_force"]
-            else:
-                order_data["timeInForce"] = CONSTANTS.DEFAULT_TIME_IN_FORCE
+                order_data["price"] = format(price, "f")
                 
             # Add client ID if we can fit it (Backpack uses uint32)
-            try:
-                # Extract numeric part from order_id if it contains prefix
-                numeric_id = order_id.split("-")[-1] if "-" in order_id else order_id
-                # Try to convert to int and check if it fits in uint32
-                client_id = int(numeric_id)
-                if 0 <= client_id <= 4294967295:  # uint32 max
-                    order_data["clientId"] = client_id
-            except (ValueError, OverflowError):
-                # If conversion fails, skip client ID
-                pass
+            client_id = self._numeric_client_id(order_id)
+            if client_id is not None:
+                order_data["clientId"] = client_id
             
             # Add any additional parameters from kwargs
-            if "post_only" in kwargs and kwargs["post_only"]:
+            if kwargs.get("post_only"):
                 order_data["postOnly"] = True
                 
             # Log the order request for debugging
-            self.logger().debug(f"Sending order request to {CONSTANTS.ORDER_PATH_URL}: {order_data}")
+            self.logger().debug("Sending order request to %s: %s", CONSTANTS.ORDER_PATH_URL, order_data)
                 
             # Send order to exchange
-            response = await self._api_post(
-                path_url=CONSTANTS.ORDER_PATH_URL,
-                data=order_data,
-                is_auth_required=True
-            )
+            response = await self._submit_order_request(order_data)
             
             # Log the response type and content for debugging
-            self.logger().debug(f"Order response type: {type(response)}")
+            self.logger().debug("Order response type: %s", type(response))
             
             # Check if response is a dictionary
             if not isinstance(response, dict):
@@ -734,7 +910,7 @@ class BackpackExchange(ExchangePyBase):
                     raise ValueError(f"Invalid response format from exchange: expected dict, got {type(response).__name__}")
             
             # Log successful response
-            self.logger().debug(f"Order response: {response}")
+            self.logger().debug("Order response: %s", response)
             
             # Extract exchange order ID from response
             exchange_order_id = str(response.get("id", ""))
@@ -744,7 +920,11 @@ class BackpackExchange(ExchangePyBase):
                 self.logger().error(f"No order ID in response. Full response: {response}")
                 raise ValueError(f"No order ID returned from exchange: {response}")
                 
-            self.logger().info(f"Successfully placed order {order_id} -> exchange order ID: {exchange_order_id}")
+            self.logger().info("Successfully placed order %s -> exchange order ID: %s", order_id, exchange_order_id)
+            
+            tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+            if tracked_order is not None:
+                self._exchange_id_index[exchange_order_id] = tracked_order
             
             # Return both exchange order ID and current timestamp
             # Base class expects a tuple of (exchange_order_id, update_timestamp)
@@ -757,6 +937,78 @@ class BackpackExchange(ExchangePyBase):
             )
             raise
 
+    async def _submit_order_request(self, order_data: Dict[str, Any]) -> Any:
+        """
+        Send an order placement request to the exchange
+        
+        When order batching is enabled, orders submitted within BATCH_ORDER_WINDOW_SECONDS of each other
+        are sent together in one batch request instead of one request per order.
+        
+        :param order_data: Order request payload
+        :return: The exchange response for this order
+        """
+        if not self._batch_orders_enabled:
+            return await self._api_post(
+                path_url=CONSTANTS.ORDER_PATH_URL,
+                data=order_data,
+                is_auth_required=True
+            )
+        
+        order_future = asyncio.get_running_loop().create_future()
+        self._pending_order_requests.append((order_future, order_data))
+        if len(self._pending_order_requests) == 1:
+            # First order of a new batch window
+            safe_ensure_future(self._flush_pending_order_requests())
+        return await order_future
+
+    async def _flush_pending_order_requests(self) -> None:
+        """
+        Wait for the batch window to close and send every order request submitted during it
+        """
+        await self._sleep(CONSTANTS.BATCH_ORDER_WINDOW_SECONDS)
+        pending_order_requests, self._pending_order_requests = self._pending_order_requests, []
+        max_size = CONSTANTS.BATCH_ORDER_MAX_SIZE
+        await safe_gather(
+            *[self._send_order_batch(pending_order_requests[i:i + max_size])
+              for i in range(0, len(pending_order_requests), max_size)]
+        )
+
+    async def _send_order_batch(self, order_requests: List[Tuple[asyncio.Future, Dict[str, Any]]]) -> None:
+        """
+        Send a group of order requests and resolve each waiting order with its own response
+        
+        :param order_requests: Futures awaited by the placing coroutines, with their order payloads
+        """
+        try:
+            if len(order_requests) == 1:
+                responses = [await self._api_post(
+                    path_url=CONSTANTS.ORDER_PATH_URL,
+                    data=order_requests[0][1],
+                    is_auth_required=True
+                )]
+            else:
+                responses = await self._api_post(
+                    path_url=CONSTANTS.BATCH_ORDER_PATH_URL,
+                    data=[order_data for _, order_data in order_requests],
+                    is_auth_required=True
+                )
+            if not isinstance(responses, list) or len(responses) != len(order_requests):
+                raise ValueError(f"Unexpected batch order response from exchange: {responses}")
+        except asyncio.CancelledError:
+            for order_future, _ in order_requests:
+                order_future.cancel()
+            raise
+        except Exception as e:
+            for order_future, _ in order_requests:
+                if not order_future.done():
+                    order_future.set_exception(e)
+            return
+        
+        # Batch responses are returned in request order
+        for (order_future, _), response in zip(order_requests, responses):
+            if not order_future.done():
+                order_future.set_result(response)
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder) -> bool:
         """
         Cancel an order on the exchange
@@ -770,27 +1022,19 @@ class BackpackExchange(ExchangePyBase):
             return True
             
         try:
-            exchange_order_id = await tracked_order.get_exchange_order_id()
+            exchange_order_id = tracked_order.exchange_order_id or await tracked_order.get_exchange_order_id()
             
-            # Build cancel request payload
-            cancel_data = {
-                "symbol": utils.convert_to_exchange_trading_pair(tracked_order.trading_pair),
-                "orderId": exchange_order_id
-            }
-            
-            # Alternatively, use clientId if available and exchange order ID is not yet known
-            if not exchange_order_id and tracked_order.client_order_id:
-                try:
-                    # Extract numeric part from client order ID
-                    numeric_id = tracked_order.client_order_id.split("-")[-1] if "-" in tracked_order.client_order_id else tracked_order.client_order_id
-                    client_id = int(numeric_id)
-                    if 0 <= client_id <= 4294967295:  # uint32 max
-                        cancel_data = {
-                            "symbol": utils.convert_to_exchange_trading_pair(tracked_order.trading_pair),
-                            "clientId": client_id
-                        }
-                except (ValueError, OverflowError):
-                    pass
+            # Build cancel request payload, identifying the order by clientId if the exchange order ID
+            # is not yet known and the client order ID has a numeric form
+            client_id = (
+                self._numeric_client_id(tracked_order.client_order_id)
+                if not exchange_order_id and tracked_order.client_order_id else None
+            )
+            cancel_data = {"symbol": self._exchange_symbol(tracked_order.trading_pair)}
+            if client_id is not None:
+                cancel_data["clientId"] = client_id
+            else:
+                cancel_data["orderId"] = exchange_order_id
             
             # Send cancel request
             response = await self._api_delete(
@@ -821,31 +1065,68 @@ class BackpackExchange(ExchangePyBase):
         # This method is called by the base class but we handle it in _update_trading_rules
         return []
 
+    async def _get_markets(self) -> Any:
+        """
+        Return the markets response, reusing the last one for MARKETS_CACHE_TTL seconds
+        
+        Concurrent callers wait for a single request instead of each fetching the markets.
+        """
+        async with self._markets_lock:
+            if (self._markets_cache is not None
+                    and time.time() - self._markets_cache_timestamp < CONSTANTS.MARKETS_CACHE_TTL):
+                return self._markets_cache
+            self.logger().debug("Fetching markets from %s", CONSTANTS.MARKETS_PATH_URL)
+            markets = await self._api_get(path_url=CONSTANTS.MARKETS_PATH_URL, is_auth_required=False)
+            self._markets_cache = markets
+            self._markets_cache_timestamp = time.time()
+            return markets
+
+    async def _make_trading_rules_request(self) -> Any:
+        return await self._get_markets()
+
+    async def _make_trading_pairs_request(self) -> Any:
+        return await self._get_markets()
+
+    async def _get_rest_assistant(self) -> RESTAssistant:
+        """Return the shared REST assistant, creating it on the first request"""
+        if self._rest_assistant is None:
+            self._rest_assistant = await self._web_assistants_factory.get_rest_assistant()
+        return self._rest_assistant
+
+    def _rest_url(self, path_url: str, is_auth_required: bool) -> str:
+        """Return the full REST URL for a path, building it only the first time it is requested"""
+        key = (path_url, is_auth_required)
+        url = self._rest_url_cache.get(key)
+        if url is None:
+            if is_auth_required:
+                url = web_utils.private_rest_url(path_url, self._domain)
+            else:
+                url = web_utils.public_rest_url(path_url, self._domain)
+            self._rest_url_cache[key] = url
+        return url
+
     async def _api_get(self,
                       path_url: str,
                       params: Optional[Dict[str, Any]] = None,
                       is_auth_required: bool = False,
                       limit_id: Optional[str] = None) -> Any:
         """Execute GET request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-        
+        rest_assistant = await self._get_rest_assistant()
+        url = self._rest_url(path_url, is_auth_required)
+
         try:
-            response = await rest_assistant.execute_request(
+            response = await self._execute_rest_request(
+                rest_assistant,
+                method=RESTMethod.GET,
                 url=url,
                 throttler_limit_id=limit_id or path_url,
                 params=params,
-                method=RESTMethod.GET,
                 is_auth_required=is_auth_required
             )
             
-            # Log successful responses for debugging
-            if path_url in [CONSTANTS.BALANCES_PATH_URL, CONSTANTS.MARKETS_PATH_URL]:
-                self.logger().debug(f"API GET {path_url} response: {response}")
+            # Log successful responses for debugging (formatted only when debug logging is enabled)
+            if path_url in (CONSTANTS.BALANCES_PATH_URL, CONSTANTS.MARKETS_PATH_URL):
+                self.logger().debug("API GET %s response: %s", path_url, response)
                 
             return response
             
@@ -857,39 +1138,36 @@ class BackpackExchange(ExchangePyBase):
 
     async def _api_post(self,
                        path_url: str,
-                       data: Optional[Dict[str, Any]] = None,
+                       data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
                        is_auth_required: bool = False,
                        limit_id: Optional[str] = None) -> Any:
         """Execute POST request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-        
+        rest_assistant = await self._get_rest_assistant()
+        url = self._rest_url(path_url, is_auth_required)
+
         try:
             # Log the request for debugging
-            self.logger().debug(f"API POST {path_url} request data: {data}")
+            self.logger().debug("API POST %s request data: %s", path_url, data)
             
-            response = await rest_assistant.execute_request(
+            response = await self._execute_rest_request(
+                rest_assistant,
+                method=RESTMethod.POST,
                 url=url,
                 throttler_limit_id=limit_id or path_url,
                 data=data,
-                method=RESTMethod.POST,
                 is_auth_required=is_auth_required
             )
             
             # Log successful response for debugging
-            self.logger().debug(f"API POST {path_url} response type: {type(response)}")
+            self.logger().debug("API POST %s response type: %s", path_url, type(response))
             if isinstance(response, dict):
-                self.logger().debug(f"API POST {path_url} response: {response}")
+                self.logger().debug("API POST %s response: %s", path_url, response)
             elif isinstance(response, str):
                 self.logger().warning(f"API POST {path_url} returned string response: {response[:200]}...")
                 
             return response
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger().error(f"Failed to parse JSON response from {path_url}. Error: {str(e)}")
             # Try to get the raw response text for debugging
             raise ValueError(f"Invalid JSON response from {path_url}: {str(e)}")
@@ -906,22 +1184,79 @@ class BackpackExchange(ExchangePyBase):
                          is_auth_required: bool = False,
                          limit_id: Optional[str] = None) -> Any:
         """Execute DELETE request"""
-        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
-        
-        if is_auth_required:
-            url = web_utils.private_rest_url(path_url, self._domain)
-        else:
-            url = web_utils.public_rest_url(path_url, self._domain)
-            
-        return await rest_assistant.execute_request(
+        rest_assistant = await self._get_rest_assistant()
+        url = self._rest_url(path_url, is_auth_required)
+
+        return await self._execute_rest_request(
+            rest_assistant,
+            method=RESTMethod.DELETE,
             url=url,
             throttler_limit_id=limit_id or path_url,
             params=params,
             data=data,
-            method=RESTMethod.DELETE,
             is_auth_required=is_auth_required
         )
 
+    async def _execute_rest_request(self, rest_assistant, method: RESTMethod, **request_kwargs) -> Any:
+        """
+        Execute a REST request and decode its JSON body
+        
+        Idempotent GET requests are retried on transient failures (timeouts, connection errors,
+        HTTP 429/5xx) with jittered exponential backoff. Order placement and cancellation are never
+        retried here, since a lost response does not mean the exchange rejected the request.
+        
+        A rate limit response opens a backoff window shared by all requests, so concurrent callers
+        wait out a single window instead of each backing off on its own. The window widens while rate
+        limit errors keep arriving and resets after the next successful request.
+        """
+        max_attempts = CONSTANTS.API_MAX_RETRIES if method == RESTMethod.GET else 1
+        for attempt in range(max_attempts):
+            rate_limit_wait = self._rate_limited_until - time.time()
+            if rate_limit_wait > 0:
+                await self._sleep(rate_limit_wait)
+            try:
+                raw_response = await rest_assistant.execute_request_and_get_response(method=method, **request_kwargs)
+                self._successive_rate_limit_errors = 0
+                return await web_utils.parse_json_response(raw_response)
+            except asyncio.CancelledError:
+                raise
+            except Exception as request_exception:
+                delay = CONSTANTS.API_RETRY_BACKOFF_SECONDS * (2 ** attempt) * (0.5 + random.random())
+                is_rate_limited = self._is_rate_limit_error(request_exception)
+                if is_rate_limited:
+                    # Successive rate limit errors widen the shared window exponentially, up to a cap
+                    self._successive_rate_limit_errors += 1
+                    window = min(CONSTANTS.RATE_LIMIT_MAX_BACKOFF_SECONDS,
+                                 max(delay, 2 ** (self._successive_rate_limit_errors - 3)))
+                    self._rate_limited_until = max(self._rate_limited_until, time.time() + window)
+                if attempt + 1 >= max_attempts or not self._is_retryable_request_error(request_exception):
+                    raise
+                self.logger().warning(f"{method.name} {request_kwargs.get('url')} failed ({request_exception}). "
+                                      f"Retrying in {delay:.2f}s")
+                if not is_rate_limited:
+                    # Rate limited retries wait out the shared window at the top of the loop instead
+                    await self._sleep(delay)
+
+    @staticmethod
+    def _is_rate_limit_error(request_exception: Exception) -> bool:
+        """Check if a failed request was rejected by the exchange rate limit"""
+        if not isinstance(request_exception, IOError):
+            return False
+        match = _HTTP_STATUS_RE.search(str(request_exception))
+        return match is not None and int(match.group(1)) == CONSTANTS.RATE_LIMIT_HTTP_STATUS
+
+    @staticmethod
+    def _is_retryable_request_error(request_exception: Exception) -> bool:
+        """Check if a failed request is worth retrying"""
+        if isinstance(request_exception, PermissionError):
+            return False
+        if isinstance(request_exception, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+            return True
+        if isinstance(request_exception, IOError):
+            match = _HTTP_STATUS_RE.search(str(request_exception))
+            return match is not None and int(match.group(1)) in CONSTANTS.RETRYABLE_HTTP_STATUSES
+        return False
+
     async def _update_order_status(self) -> None:
         """
         Update status of all in-flight orders by querying the exchange
@@ -929,6 +1264,10 @@ class BackpackExchange(ExchangePyBase):
         # Get list of in-flight orders that need status updates
         tracked_orders = list(self.in_flight_orders.values())
         
+        # Drop index entries of orders that reached a final state outside of the user stream
+        for exchange_order_id in [eid for eid, order in self._exchange_id_index.items() if order.is_done]:
+            del self._exchange_id_index[exchange_order_id]
+        
         if not tracked_orders:
             return
         
@@ -947,6 +1286,19 @@ class BackpackExchange(ExchangePyBase):
                     )
                     self._order_tracker.process_order_update(order_update)
             return
+        
+        # While the user stream is delivering events, orders it updated recently need no REST reconciliation
+        current_timestamp = self.current_timestamp
+        last_user_stream_message_time = (
+            0 if self._user_stream_tracker is None else self._user_stream_tracker.last_recv_time
+        )
+        if last_user_stream_message_time > 0 and current_timestamp - last_user_stream_message_time <= self.TICK_INTERVAL_LIMIT:
+            tracked_orders = [
+                tracked_order for tracked_order in tracked_orders
+                if current_timestamp - tracked_order.last_update_timestamp > self.TICK_INTERVAL_LIMIT
+            ]
+            if not tracked_orders:
+                return
             
         try:
             # Query all open orders from exchange
@@ -955,46 +1307,53 @@ class BackpackExchange(ExchangePyBase):
                 is_auth_required=True
             )
             
-            # Create a map of order IDs for quick lookup
-            open_order_ids = {str(order.get("id")): order for order in open_orders}
+            # Map open orders by exchange ID, and by client ID only when some tracked order has no exchange ID yet
+            open_order_ids = {}
             open_client_ids = {}
-            
-            # Also map by client ID if available
+            map_client_ids = any(tracked_order.exchange_order_id is None for tracked_order in tracked_orders)
             for order in open_orders:
-                if "clientId" in order:
-                    open_client_ids[str(order["clientId"])] = order
+                open_order_ids[str(order.get("id"))] = order
+                if map_client_ids:
+                    client_id = order.get("clientId")
+                    if client_id is not None:
+                        open_client_ids[int(client_id)] = order
+            
+            # Orders missing from the open orders list, queried individually afterwards
+            orders_to_request = []
             
-            # Update status of tracked orders
+            # Update status of tracked orders, stamping every update of this pass with one timestamp
+            update_timestamp = time.time()
             for tracked_order in tracked_orders:
-                exchange_order_id = await tracked_order.get_exchange_order_id()
+                # Read the exchange order ID directly instead of waiting for orders still being created
+                exchange_order_id = tracked_order.exchange_order_id
                 
                 # Try to find order by exchange ID or client ID
-                exchange_order = None
-                if exchange_order_id and exchange_order_id in open_order_ids:
-                    exchange_order = open_order_ids[exchange_order_id]
-                elif tracked_order.client_order_id:
-                    # Try to extract numeric client ID
-                    try:
-                        numeric_id = tracked_order.client_order_id.split("-")[-1]
-                        if numeric_id in open_client_ids:
-                            exchange_order = open_client_ids[numeric_id]
-                    except:
-                        pass
+                if exchange_order_id is not None:
+                    exchange_order = open_order_ids.get(exchange_order_id)
+                else:
+                    exchange_order = open_client_ids.get(self._numeric_client_id(tracked_order.client_order_id))
                 
                 if exchange_order:
                     # Update order status from exchange data
-                    await self._process_order_update(tracked_order, exchange_order)
+                    await self._process_order_update(tracked_order, exchange_order, update_timestamp)
                 else:
                     # Order not found in open orders - might be filled or cancelled
-                    # Request specific order status
-                    try:
-                        order_update = await self._request_order_status(tracked_order)
-                        if order_update:
-                            tracked_order.update_with_order_update(order_update)
-                    except Exception as e:
-                        self.logger().warning(
-                            f"Failed to get status for order {tracked_order.client_order_id}: {e}"
-                        )
+                    orders_to_request.append(tracked_order)
+            
+            # Request the specific status of every missing order concurrently
+            order_updates = await safe_gather(
+                *[self._request_order_status(tracked_order) for tracked_order in orders_to_request],
+                return_exceptions=True
+            )
+            for tracked_order, order_update in zip(orders_to_request, order_updates):
+                if isinstance(order_update, asyncio.CancelledError):
+                    raise order_update
+                if isinstance(order_update, Exception):
+                    self.logger().warning(
+                        f"Failed to get status for order {tracked_order.client_order_id}: {order_update}"
+                    )
+                elif order_update:
+                    tracked_order.update_with_order_update(order_update)
                         
         except Exception as e:
             self.logger().error(
@@ -1005,22 +1364,28 @@ class BackpackExchange(ExchangePyBase):
     async def _user_stream_event_listener(self) -> None:
         """
         Listen to user stream events for real-time order and balance updates
+        
+        Consecutive handler errors back off exponentially with jitter instead of a fixed pause.
         """
+        error_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
         async for event_message in self._iter_user_event_queue():
             try:
                 # Backpack order update events
                 event_type = event_message.get("e")
+                handler = self._user_stream_event_handlers.get(event_type)
                 
-                if event_type in ["orderAccepted", "orderCancelled", "orderExpired", "orderFill", "orderModified"]:
-                    await self._process_ws_order_update(event_message)
+                if handler is not None:
+                    await handler(event_message)
                 else:
-                    self.logger().debug(f"Unknown user stream event type: {event_type}")
+                    self.logger().debug("Unknown user stream event type: %s", event_type)
+                error_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
                     
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().exception("Unexpected error in user stream listener")
-                await self._sleep(5.0)
+                await self._sleep(error_backoff * (0.5 + random.random()))
+                error_backoff = min(error_backoff * 2, CONSTANTS.USER_STREAM_BACKOFF_MAX_SECONDS)
     
     async def _process_ws_order_update(self, event_message: Dict[str, Any]) -> None:
         """
@@ -1033,70 +1398,45 @@ class BackpackExchange(ExchangePyBase):
             exchange_order_id = str(event_message.get("i", ""))
             symbol = event_message.get("s", "")
             
-            # Try to find the order by client order ID or exchange order ID
-            tracked_order = None
-            if client_order_id:
-                tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            # Try to find the order by exchange order ID, then by client order ID
+            tracked_order = self._exchange_id_index.get(exchange_order_id) if exchange_order_id else None
+            if tracked_order is None:
+                fillable_orders = self._order_tracker.all_fillable_orders
+                if client_order_id:
+                    tracked_order = fillable_orders.get(client_order_id)
+                if tracked_order is None and exchange_order_id:
+                    tracked_order = next(
+                        (order for order in fillable_orders.values() if order.exchange_order_id == exchange_order_id),
+                        None
+                    )
+                if tracked_order is None:
+                    return
+                if exchange_order_id:
+                    self._exchange_id_index[exchange_order_id] = tracked_order
             
-            if not tracked_order and exchange_order_id:
-                # Search by exchange order ID
-                for order in self._order_tracker.all_fillable_orders.values():
-                    if order.exchange_order_id == exchange_order_id:
-                        tracked_order = order
-                        break
+            # Event times are in milliseconds; the fallback is already in seconds
+            event_time = event_message.get("E")
+            update_timestamp = event_time / 1000 if event_time is not None else self.current_timestamp
+            client_order_id = tracked_order.client_order_id
+            trading_pair = tracked_order.trading_pair
             
-            if not tracked_order:
-                return
+            # State-only events (accepted, cancelled, expired) map straight to the new order state
+            new_state = CONSTANTS.WS_ORDER_EVENT_STATE_MAP.get(event_type)
             
-            # Process different event types
-            if event_type == "orderAccepted":
-                # Order was accepted
-                order_update = OrderUpdate(
-                    trading_pair=tracked_order.trading_pair,
-                    update_timestamp=event_message.get("E", self.current_timestamp) / 1000,  # Convert from microseconds
-                    new_state=OrderState.OPEN,
-                    client_order_id=tracked_order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                )
-                self._order_tracker.process_order_update(order_update)
-                
-            elif event_type == "orderCancelled":
-                # Order was cancelled
-                order_update = OrderUpdate(
-                    trading_pair=tracked_order.trading_pair,
-                    update_timestamp=event_message.get("E", self.current_timestamp) / 1000,
-                    new_state=OrderState.CANCELED,
-                    client_order_id=tracked_order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                )
-                self._order_tracker.process_order_update(order_update)
-                
-            elif event_type == "orderExpired":
-                # Order expired
-                order_update = OrderUpdate(
-                    trading_pair=tracked_order.trading_pair,
-                    update_timestamp=event_message.get("E", self.current_timestamp) / 1000,
-                    new_state=OrderState.CANCELED,
-                    client_order_id=tracked_order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                )
-                self._order_tracker.process_order_update(order_update)
-                
-            elif event_type == "orderFill":
+            if event_type == "orderFill":
                 # Order was filled (partially or fully)
-                fill_quantity = Decimal(event_message.get("l", "0"))
-                fill_price = Decimal(event_message.get("L", "0"))
-                executed_quantity = Decimal(event_message.get("z", "0"))
-                fee_amount = Decimal(event_message.get("n", "0"))
+                fill_quantity = _to_decimal(event_message.get("l"))
+                fill_price = _to_decimal(event_message.get("L"))
+                fee_amount = _to_decimal(event_message.get("n"))
                 fee_token = event_message.get("N", "")
                 
                 # Create trade update
                 trade_update = TradeUpdate(
                     trade_id=str(event_message.get("t", "")),
-                    client_order_id=tracked_order.client_order_id,
+                    client_order_id=client_order_id,
                     exchange_order_id=exchange_order_id,
-                    trading_pair=tracked_order.trading_pair,
-                    fill_timestamp=event_message.get("E", self.current_timestamp) / 1000,
+                    trading_pair=trading_pair,
+                    fill_timestamp=update_timestamp,
                     fill_price=fill_price,
                     fill_base_amount=fill_quantity,
                     fill_quote_amount=fill_quantity * fill_price,
@@ -1104,33 +1444,31 @@ class BackpackExchange(ExchangePyBase):
                         fee_schema=self.trade_fee_schema(),
                         trade_type=tracked_order.trade_type,
                         percent_token=fee_token,
-                        flat_fees=[TokenAmount(amount=fee_amount, token=fee_token)]
+                        # Zero-fee fills (e.g. maker rebates settled elsewhere) carry no flat fee entry
+                        flat_fees=[TokenAmount(amount=fee_amount, token=fee_token)] if fee_amount else []
                     ),
                     is_taker=not event_message.get("m", False)
                 )
                 self._order_tracker.process_trade_update(trade_update)
                 
-                # Check if order is fully filled
-                order_state = event_message.get("X", "")
-                if order_state == "Filled" or executed_quantity >= tracked_order.amount:
-                    order_update = OrderUpdate(
-                        trading_pair=tracked_order.trading_pair,
-                        update_timestamp=event_message.get("E", self.current_timestamp) / 1000,
-                        new_state=OrderState.FILLED,
-                        client_order_id=tracked_order.client_order_id,
-                        exchange_order_id=exchange_order_id,
-                    )
-                    self._order_tracker.process_order_update(order_update)
+                # Check if order is fully filled (the executed quantity is only parsed when the status is not final)
+                if event_message.get("X", "") == "Filled" or _to_decimal(event_message.get("z")) >= tracked_order.amount:
+                    new_state = OrderState.FILLED
                 else:
-                    # Partially filled
-                    order_update = OrderUpdate(
-                        trading_pair=tracked_order.trading_pair,
-                        update_timestamp=event_message.get("E", self.current_timestamp) / 1000,
-                        new_state=OrderState.PARTIALLY_FILLED,
-                        client_order_id=tracked_order.client_order_id,
-                        exchange_order_id=exchange_order_id,
-                    )
-                    self._order_tracker.process_order_update(order_update)
+                    new_state = OrderState.PARTIALLY_FILLED
+            
+            if new_state is not None:
+                order_update = OrderUpdate(
+                    trading_pair=trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=new_state,
+                    client_order_id=client_order_id,
+                    exchange_order_id=exchange_order_id,
+                )
+                self._order_tracker.process_order_update(order_update)
+            
+            if tracked_order.is_done:
+                self._exchange_id_index.pop(exchange_order_id, None)
                     
         except Exception:
             self.logger().exception(f"Failed to process order update: {event_message}")
@@ -1145,35 +1483,38 @@ class BackpackExchange(ExchangePyBase):
         trade_updates = []
         
         try:
-            exchange_order_id = await order.get_exchange_order_id()
+            exchange_order_id = order.exchange_order_id or await order.get_exchange_order_id()
             if not exchange_order_id:
                 return trade_updates
                 
             # Query fills for this order
-            fills = await self._api_get(
-                path_url=CONSTANTS.FILLS_PATH_URL,
-                params={
-                    "orderId": exchange_order_id,
-                    "symbol": utils.convert_to_exchange_trading_pair(order.trading_pair)
-                },
-                is_auth_required=True
-            )
+            async with self._order_status_semaphore:
+                fills = await self._api_get(
+                    path_url=CONSTANTS.FILLS_PATH_URL,
+                    params={
+                        "orderId": exchange_order_id,
+                        "symbol": self._exchange_symbol(order.trading_pair)
+                    },
+                    is_auth_required=True
+                )
             
             # Convert fills to TradeUpdate objects
             for fill in fills:
                 trade_id = str(fill.get("tradeId", fill.get("id", "")))
                 if not trade_id:
                     continue
-                    
+                
+                fill_price = _to_decimal(fill.get("price"))
+                fill_quantity = _to_decimal(fill.get("quantity"))
                 trade_update = TradeUpdate(
                     trade_id=trade_id,
                     client_order_id=order.client_order_id,
                     exchange_order_id=exchange_order_id,
                     trading_pair=order.trading_pair,
                     fill_timestamp=float(fill.get("timestamp", 0)) / 1000.0,  # Convert ms to seconds
-                    fill_price=Decimal(str(fill.get("price", "0"))),
-                    fill_base_amount=Decimal(str(fill.get("quantity", "0"))),
-                    fill_quote_amount=Decimal(str(fill.get("price", "0"))) * Decimal(str(fill.get("quantity", "0"))),
+                    fill_price=fill_price,
+                    fill_base_amount=fill_quantity,
+                    fill_quote_amount=fill_price * fill_quantity,
                     fee=self._get_trade_fee_from_fill(fill),
                 )
                 trade_updates.append(trade_update)
@@ -1194,7 +1535,7 @@ class BackpackExchange(ExchangePyBase):
         :return: OrderUpdate with current status
         """
         try:
-            exchange_order_id = await tracked_order.get_exchange_order_id()
+            exchange_order_id = tracked_order.exchange_order_id or await tracked_order.get_exchange_order_id()
             
             # Build query parameters
             params = {}
@@ -1202,20 +1543,18 @@ class BackpackExchange(ExchangePyBase):
                 params["orderId"] = exchange_order_id
             else:
                 # Try using client ID
-                try:
-                    numeric_id = tracked_order.client_order_id.split("-")[-1]
-                    client_id = int(numeric_id)
-                    if 0 <= client_id <= 4294967295:
-                        params["clientId"] = client_id
-                except:
+                client_id = self._numeric_client_id(tracked_order.client_order_id)
+                if client_id is None:
                     raise ValueError("No valid order ID available for status query")
+                params["clientId"] = client_id
             
             # Query order status
-            response = await self._api_get(
-                path_url=CONSTANTS.ORDER_PATH_URL,
-                params=params,
-                is_auth_required=True
-            )
+            async with self._order_status_semaphore:
+                response = await self._api_get(
+                    path_url=CONSTANTS.ORDER_PATH_URL,
+                    params=params,
+                    is_auth_required=True
+                )
             
             # Convert response to OrderUpdate
             return self._create_order_update_from_exchange_order(response, tracked_order)
@@ -1231,9 +1570,8 @@ class BackpackExchange(ExchangePyBase):
         """Initialize trading pair symbols"""
         # For Backpack, the symbols are the same (no conversion needed)
         # But we need to populate the symbol map for the connector to be ready
-        self.logger().debug(f"Initializing trading pair symbols with exchange_info type: {type(exchange_info)}, length: {len(exchange_info) if hasattr(exchange_info, '__len__') else 'N/A'}")
         
-        mapping = {}
+        mapping = bidict()
         
         if isinstance(exchange_info, list):
             # Assume exchange_info is a list of market data
@@ -1244,57 +1582,96 @@ class BackpackExchange(ExchangePyBase):
                     hb_symbol = exchange_symbol.replace("_", "-")  # e.g., "SOL-USDC"
                     mapping[exchange_symbol] = hb_symbol
         
-        self.logger().info(f"Initialized trading pair symbol map with {len(mapping)} pairs: {mapping}")
+        self.logger().info("Initialized trading pair symbol map with %s pairs", len(mapping))
+        self.logger().debug("Trading pair symbol map: %s", mapping)
         # Even if no markets, set an empty map so status check passes
         self._set_trading_pair_symbol_map(mapping)
 
+    async def exchange_symbol_associated_to_pair(self, trading_pair: str) -> str:
+        """
+        Resolve the exchange symbol directly from the initialized symbol map, skipping the extra
+        trading_pair_symbol_map() coroutine on the common path
+        """
+        if self.trading_pair_symbol_map_ready():
+            exchange_symbol = self._trading_pair_symbol_map.inverse.get(trading_pair)
+            if exchange_symbol is not None:
+                return exchange_symbol
+        return await super().exchange_symbol_associated_to_pair(trading_pair)
+
+    async def trading_pair_associated_to_exchange_symbol(self, symbol: str) -> str:
+        """
+        Resolve the trading pair directly from the initialized symbol map, skipping the extra
+        trading_pair_symbol_map() coroutine on the common path
+        """
+        if self.trading_pair_symbol_map_ready():
+            trading_pair = self._trading_pair_symbol_map.get(symbol)
+            if trading_pair is not None:
+                return trading_pair
+        return await super().trading_pair_associated_to_exchange_symbol(symbol)
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         """Get last traded price for a trading pair"""
-        exchange_symbol = utils.convert_to_exchange_trading_pair(trading_pair)
-        
         ticker = await self._api_get(
             path_url=CONSTANTS.TICKER_PATH_URL,
-            params={"symbol": exchange_symbol},
+            params={"symbol": self._exchange_symbol(trading_pair)},
             is_auth_required=False
         )
         
-        return float(ticker.get("lastPrice", 0))
+        last_price = ticker.get("lastPrice")
+        return float(last_price) if last_price is not None else 0.0
     
-    def _create_order_update_from_exchange_order(self, order_data: Dict[str, Any], tracked_order: InFlightOrder) -> OrderUpdate:
+    def _create_order_update_from_exchange_order(
+        self,
+        order_data: Dict[str, Any],
+        tracked_order: InFlightOrder,
+        update_timestamp: Optional[float] = None,
+    ) -> OrderUpdate:
         """
         Create an OrderUpdate object from exchange order data
         
         :param order_data: Order data from exchange
         :param tracked_order: The tracked order
+        :param update_timestamp: Timestamp of the update, defaults to the current time
         :return: OrderUpdate object
         """
         # Map exchange status to OrderState
         exchange_status = order_data.get("status", "")
-        new_state = CONSTANTS.ORDER_STATE_MAP.get(exchange_status, OrderState.OPEN)
+        new_state = _order_state_of(exchange_status, OrderState.OPEN)
+        exchange_order_id = order_data.get("id", "")
         
         # Create OrderUpdate
         order_update = OrderUpdate(
             trading_pair=tracked_order.trading_pair,
-            update_timestamp=time.time(),
+            update_timestamp=time.time() if update_timestamp is None else update_timestamp,
             new_state=new_state,
             client_order_id=tracked_order.client_order_id,
-            exchange_order_id=str(order_data.get("id", "")),
+            exchange_order_id=exchange_order_id if isinstance(exchange_order_id, str) else str(exchange_order_id),
         )
         
         return order_update
     
-    async def _process_order_update(self, tracked_order: InFlightOrder, order_data: Dict[str, Any]) -> None:
+    async def _process_order_update(
+        self,
+        tracked_order: InFlightOrder,
+        order_data: Dict[str, Any],
+        update_timestamp: Optional[float] = None,
+    ) -> None:
         """
         Process an order update from exchange data
         
         :param tracked_order: The tracked order to update
         :param order_data: Order data from exchange
+        :param update_timestamp: Timestamp of the update, defaults to the current time
         """
-        order_update = self._create_order_update_from_exchange_order(order_data, tracked_order)
+        order_update = self._create_order_update_from_exchange_order(order_data, tracked_order, update_timestamp)
         tracked_order.update_with_order_update(order_update)
         
         # If order is filled, get trade updates
         if order_update.new_state == OrderState.FILLED:
+            # Skip the fills round trip when the user stream already delivered the whole executed quantity
+            executed_quantity = order_data.get("executedQuantity")
+            if executed_quantity is not None and tracked_order.executed_amount_base >= _to_decimal(executed_quantity):
+                return
             trade_updates = await self._all_trade_updates_for_order(tracked_order)
             for trade_update in trade_updates:
                 tracked_order.update_with_trade_update(trade_update)
@@ -1306,21 +1683,23 @@ class BackpackExchange(ExchangePyBase):
         :param fill_data: Fill data from exchange
         :return: TradeFeeBase object
         """
-        fee_amount = Decimal(str(fill_data.get("fee", "0")))
+        fee_amount = _to_decimal(fill_data.get("fee"))
         fee_asset = fill_data.get("feeSymbol", "")
+        fee_schema = self.trade_fee_schema()
+        trade_type = CONSTANTS.SIDE_TRADE_TYPE_MAP.get(fill_data.get("side"), TradeType.SELL)
         
         if fee_amount > 0 and fee_asset:
             return TradeFeeBase.new_spot_fee(
-                fee_schema=self.trade_fee_schema(),
-                trade_type=TradeType.BUY if fill_data.get("side") == "Bid" else TradeType.SELL,
+                fee_schema=fee_schema,
+                trade_type=trade_type,
                 percent_token=fee_asset,
                 flat_fees=[TokenAmount(amount=fee_amount, token=fee_asset)]
             )
         else:
             # Return default fee if no fee info available
             return TradeFeeBase.new_spot_fee(
-                fee_schema=self.trade_fee_schema(),
-                trade_type=TradeType.BUY if fill_data.get("side") == "Bid" else TradeType.SELL,
+                fee_schema=fee_schema,
+                trade_type=trade_type,
             )
 
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
@@ -1331,15 +1710,8 @@ class BackpackExchange(ExchangePyBase):
         - INVALID_ORDER: The order is invalid (doesn't exist or wrong format)
         - RESOURCE_NOT_FOUND: The requested resource was not found
         """
-        error_message = str(cancelation_exception).upper()
-        
         # Check for specific Backpack error codes
-        return (
-            "INVALID_ORDER" in error_message or
-            "RESOURCE_NOT_FOUND" in error_message or
-            "ORDER NOT FOUND" in error_message or
-            "UNKNOWN ORDER" in error_message
-        )
+        return _ORDER_NOT_FOUND_ERROR_RE.search(str(cancelation_exception)) is not None
 
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
         """
@@ -1349,16 +1721,8 @@ class BackpackExchange(ExchangePyBase):
         - INVALID_ORDER: The order is invalid (doesn't exist or wrong format)
         - RESOURCE_NOT_FOUND: The requested resource was not found
         """
-        error_message = str(status_update_exception).upper()
-        
         # Check for specific Backpack error codes
-        return (
-            "INVALID_ORDER" in error_message or
-            "RESOURCE_NOT_FOUND" in error_message or
-            "ORDER NOT FOUND" in error_message or
-            "UNKNOWN ORDER" in error_message or
-            "ORDER DOES NOT EXIST" in error_message
-        )
+        return _ORDER_NOT_FOUND_STATUS_ERROR_RE.search(str(status_update_exception)) is not None
 
     async def _update_trading_fees(self) -> None:
         """
@@ -1,11 +1,16 @@
 from typing import Any, Dict, Optional
 import time
 
+import aiohttp
+import ujson
+
 import hummingbot.connector.exchange.backpack.backpack_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import RESTResponse
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -41,6 +46,28 @@ def wss_url(domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
     return CONSTANTS.WSS_URL
 
 
+class BackpackConnectionsFactory(ConnectionsFactory):
+    """
+    Connections factory whose shared aiohttp session keeps connections to Backpack alive between requests,
+    so repeated REST calls (order placement, status polling) reuse the same TCP/TLS connection
+    """
+    _instance = None
+    _ws_independent_session = None
+    _shared_client = None
+
+    async def _get_shared_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None:
+            connector = aiohttp.TCPConnector(
+                limit=CONSTANTS.REST_CONNECTION_LIMIT,
+                keepalive_timeout=CONSTANTS.REST_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=CONSTANTS.REST_DNS_CACHE_TTL,
+                # Abort TLS connections the server closed uncleanly instead of leaving them to linger in the pool
+                enable_cleanup_closed=True,
+            )
+            self._shared_client = aiohttp.ClientSession(connector=connector)
+        return self._shared_client
+
+
 def build_api_factory(
     throttler: Optional[AsyncThrottler] = None,
     time_synchronizer: Optional[TimeSynchronizer] = None,
@@ -59,10 +86,24 @@ def build_api_factory(
         auth=auth,
         rest_pre_processors=[],
         rest_post_processors=[],
+        connections_factory=BackpackConnectionsFactory(),
     )
     return api_factory
 
 
+async def parse_json_response(response: RESTResponse) -> Any:
+    """
+    Decode a REST response body using ujson instead of the stdlib json decoder
+
+    :param response: The response returned by the REST assistant
+    :return: The decoded JSON payload, or None if the body is empty
+    """
+    text = await response.text()
+    if not text or text.isspace():
+        return None
+    return ujson.loads(text)
+
+
 def get_order_book_url(trading_pair: str) -> str:
     """
     Get the URL for order book data
@@ -182,6 +182,154 @@ class BackpackPerpetualDerivativeTest(unittest.TestCase):
         self.assertEqual(btc_rule.min_price_increment, Decimal("0.01"))
         self.assertEqual(btc_rule.min_notional_size, Decimal("10"))
 
+    @patch("hummingbot.connector.derivative.backpack_perpetual.backpack_perpetual_derivative.BackpackPerpetualDerivative._api_get")
+    def test_update_trading_rules_fills_symbol_map_from_same_markets_response(self, mock_api_get):
+        mock_api_get.return_value = [
+            {
+                "symbol": self.exchange_trading_pair,
+                "status": "ONLINE",
+                "marketType": "PERP",
+                "filters": {"price": {"tickSize": "0.01"}, "quantity": {"minQuantity": "0.001", "stepSize": "0.001"}},
+            },
+            {"symbol": "ETH_USDC_PERP", "status": "ONLINE", "marketType": "PERP", "filters": {}},
+        ]
+
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        mock_api_get.assert_awaited_once()
+        self.assertTrue(self.exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(self.trading_pair, self.exchange._trading_pair_symbol_map[self.exchange_trading_pair])
+        self.assertEqual("ETH-USDC-PERP", self.exchange._trading_pair_symbol_map["ETH_USDC_PERP"])
+
+    def _mock_rest_assistant(self, body: str) -> MagicMock:
+        response = AsyncMock()
+        response.text.return_value = body
+        rest_assistant = MagicMock()
+        rest_assistant.execute_request_and_get_response = AsyncMock(return_value=response)
+        self.exchange._web_assistants_factory.get_rest_assistant = AsyncMock(return_value=rest_assistant)
+        return rest_assistant
+
+    def test_api_request_returns_decoded_body_and_reuses_rest_assistant(self):
+        rest_assistant = self._mock_rest_assistant('[{"symbol": "BTC_USDC_PERP", "lastPrice": "50000"}]')
+
+        first = self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.TICKER_PATH_URL))
+        second = self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.TICKER_PATH_URL))
+
+        self.assertEqual([{"symbol": "BTC_USDC_PERP", "lastPrice": "50000"}], first)
+        self.assertEqual(first, second)
+        self.exchange._web_assistants_factory.get_rest_assistant.assert_awaited_once()
+        self.assertEqual(2, rest_assistant.execute_request_and_get_response.await_count)
+        request_kwargs = rest_assistant.execute_request_and_get_response.call_args.kwargs
+        self.assertEqual(f"{CONSTANTS.REST_URL}{CONSTANTS.TICKER_PATH_URL}", request_kwargs["url"])
+        self.assertEqual(CONSTANTS.TICKER_PATH_URL, request_kwargs["throttler_limit_id"])
+
+    def test_api_request_returns_none_for_empty_body(self):
+        self._mock_rest_assistant("")
+
+        result = self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.TICKER_PATH_URL))
+
+        self.assertIsNone(result)
+
+    def test_api_request_passes_overwrite_url_and_limit_id(self):
+        rest_assistant = self._mock_rest_assistant('{"status": "ok"}')
+
+        self.async_run_with_timeout(self.exchange._api_get(
+            path_url=CONSTANTS.TICKER_PATH_URL,
+            overwrite_url="https://example.com/custom",
+            limit_id=CONSTANTS.MARKETS_PATH_URL,
+        ))
+
+        request_kwargs = rest_assistant.execute_request_and_get_response.call_args.kwargs
+        self.assertEqual("https://example.com/custom", request_kwargs["url"])
+        self.assertEqual(CONSTANTS.MARKETS_PATH_URL, request_kwargs["throttler_limit_id"])
+        self.assertEqual({}, self.exchange._rest_url_cache)
+
+    def test_rest_url_is_built_once_per_path(self):
+        with patch(
+            "hummingbot.connector.derivative.backpack_perpetual.backpack_perpetual_web_utils.public_rest_url",
+            return_value="https://example.com/api/v1/ticker",
+        ) as public_rest_url:
+            first = self.exchange._rest_url(CONSTANTS.TICKER_PATH_URL, is_auth_required=False)
+            second = self.exchange._rest_url(CONSTANTS.TICKER_PATH_URL, is_auth_required=False)
+
+        self.assertEqual("https://example.com/api/v1/ticker", first)
+        self.assertIs(first, second)
+        public_rest_url.assert_called_once_with(CONSTANTS.TICKER_PATH_URL, self.exchange._domain)
+
+    def test_api_request_retries_once_after_time_synchronizer_error(self):
+        response = AsyncMock()
+        response.text.return_value = '{"status": "ok"}'
+        rest_assistant = MagicMock()
+        rest_assistant.execute_request_and_get_response = AsyncMock(
+            side_effect=[IOError("HTTP status is 400. Error: Invalid timestamp"), response])
+        self.exchange._rest_assistant = rest_assistant
+        self.exchange._update_time_synchronizer = AsyncMock()
+
+        result = self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.MARKETS_PATH_URL))
+
+        self.assertEqual({"status": "ok"}, result)
+        self.exchange._update_time_synchronizer.assert_awaited_once()
+        self.assertEqual(2, rest_assistant.execute_request_and_get_response.await_count)
+
+    def test_api_request_raises_other_errors_without_retry(self):
+        rest_assistant = MagicMock()
+        rest_assistant.execute_request_and_get_response = AsyncMock(
+            side_effect=IOError("HTTP status is 400. Error: INVALID_ORDER"))
+        self.exchange._rest_assistant = rest_assistant
+        self.exchange._update_time_synchronizer = AsyncMock()
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.MARKETS_PATH_URL))
+
+        self.exchange._update_time_synchronizer.assert_not_awaited()
+        rest_assistant.execute_request_and_get_response.assert_awaited_once()
+
+    @patch("hummingbot.connector.derivative.backpack_perpetual.backpack_perpetual_derivative.BackpackPerpetualDerivative._api_get")
+    def test_update_trading_rules_skips_malformed_markets(self, mock_api_get):
+        mock_api_get.return_value = [
+            "not a market",
+            None,
+            {
+                "symbol": self.exchange_trading_pair,
+                "status": "ONLINE",
+                "marketType": "PERP",
+                "filters": {"price": {"tickSize": "0.01"}, "quantity": {"minQuantity": "0.001", "stepSize": "0.001"}},
+            },
+        ]
+
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        self.assertEqual([self.trading_pair], list(self.exchange._trading_rules))
+        self.assertEqual(self.trading_pair, self.exchange._trading_pair_symbol_map[self.exchange_trading_pair])
+
+    def test_get_fee_returns_cached_default_fees(self):
+        def get_fee(order_side: TradeType, is_maker):
+            return self.exchange._get_fee(
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                order_type=OrderType.LIMIT,
+                order_side=order_side,
+                amount=Decimal("1"),
+                price=Decimal("50000"),
+                is_maker=is_maker,
+            )
+
+        maker_fee = get_fee(TradeType.BUY, True)
+        taker_fee = get_fee(TradeType.SELL, False)
+        self.assertIs(self.exchange._default_fees[(TradeType.BUY, True)], maker_fee)
+        self.assertIs(self.exchange._default_fees[(TradeType.SELL, False)], taker_fee)
+        self.assertEqual(Decimal("0.02"), maker_fee.percent)
+        self.assertEqual(Decimal("0.05"), taker_fee.percent)
+
+        with patch(
+            "hummingbot.connector.derivative.backpack_perpetual.backpack_perpetual_utils.parse_trade_fee"
+        ) as parse_trade_fee:
+            # is_maker=None is charged as taker
+            self.assertIs(self.exchange._default_fees[(TradeType.BUY, False)], get_fee(TradeType.BUY, None))
+            self.assertIs(maker_fee, get_fee(TradeType.BUY, True))
+
+        parse_trade_fee.assert_not_called()
+
     def test_parse_trading_rule(self):
         from hummingbot.connector.derivative.backpack_perpetual import backpack_perpetual_utils as utils
         
@@ -53,6 +53,12 @@ class TestBackpackExchange(unittest.TestCase):
     def async_run_with_timeout(self, coroutine, timeout: float = 1):
         return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
     
+    def mock_rest_response(self, payload: Any):
+        """Configure the mocked REST assistant to return the given JSON payload"""
+        response = AsyncMock()
+        response.text.return_value = json.dumps(payload)
+        self.rest_assistant.execute_request_and_get_response.return_value = response
+    
     def test_update_trading_rules(self):
         """Test updating trading rules from exchange"""
         mock_response = [
@@ -72,7 +78,7 @@ class TestBackpackExchange(unittest.TestCase):
             }
         ]
         
-        self.rest_assistant.execute_request.return_value = mock_response
+        self.mock_rest_response(mock_response)
         
         self.async_run_with_timeout(self.exchange._update_trading_rules())
         
@@ -211,7 +217,7 @@ class TestBackpackExchange(unittest.TestCase):
             "lastPrice": "20.5",
         }
         
-        self.rest_assistant.execute_request.return_value = mock_response
+        self.mock_rest_response(mock_response)
         
         price = self.async_run_with_timeout(
             self.exchange._get_last_traded_price(self.trading_pair)
@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.exchange.backpack import backpack_constants as CONSTANTS
+from hummingbot.connector.exchange.backpack.backpack_api_user_stream_data_source import (
+    BackpackAPIUserStreamDataSource,
+)
+
+
+class TestBackpackAPIUserStreamDataSource(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "SOL-USDC"
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.data_source = BackpackAPIUserStreamDataSource(
+            auth=MagicMock(),
+            trading_pairs=[self.trading_pair],
+            connector=MagicMock(),
+            api_factory=MagicMock(),
+        )
+        self.log_records = []
+        self.data_source.logger().setLevel(1)
+        self.data_source.logger().addHandler(self)
+
+    def tearDown(self):
+        self.data_source.logger().removeHandler(self)
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, 30))
+
+    def _record_sleeps(self, stop_after: int) -> List[float]:
+        """Replace _sleep with a mock that records delays and cancels the stream after stop_after calls"""
+        delays: List[float] = []
+
+        async def sleep(delay: float):
+            delays.append(delay)
+            if len(delays) >= stop_after:
+                raise asyncio.CancelledError()
+
+        self.data_source._sleep = sleep
+        return delays
+
+    @patch("hummingbot.connector.exchange.backpack.backpack_api_user_stream_data_source.random.random")
+    def test_reconnect_backoff_grows_to_cap_and_resets_after_connecting(self, random_mock):
+        """Test that failed connections back off exponentially up to the cap and a successful one resets it"""
+        # 0.5 makes the jitter factor exactly 1, so the recorded delays are the raw backoff
+        random_mock.return_value = 0.5
+        ws = MagicMock()
+        ws.disconnect = AsyncMock()
+        failed_connections = 8
+        self.data_source._connected_websocket_assistant = AsyncMock(
+            side_effect=[Exception("connection failed")] * failed_connections + [ws]
+        )
+        self.data_source._subscribe_to_user_streams = AsyncMock()
+        self.data_source._process_ws_messages = AsyncMock(side_effect=Exception("stream dropped"))
+        delays = self._record_sleeps(stop_after=failed_connections + 1)
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.data_source.listen_for_user_stream(asyncio.Queue()))
+
+        min_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
+        max_backoff = CONSTANTS.USER_STREAM_BACKOFF_MAX_SECONDS
+        self.assertEqual(
+            [min_backoff * 2 ** attempt for attempt in range(6)] + [max_backoff, max_backoff],
+            delays[:failed_connections],
+        )
+        # The connection after the failures succeeded, so the next drop waits the minimum again
+        self.assertEqual(min_backoff, delays[-1])
+        self.data_source._subscribe_to_user_streams.assert_awaited_once_with(ws)
+        ws.disconnect.assert_awaited_once()
+
+    @patch("hummingbot.connector.exchange.backpack.backpack_api_user_stream_data_source.random.random")
+    def test_reconnect_backoff_applies_jitter(self, random_mock):
+        """Test that the reconnect delay is scaled by the random jitter factor"""
+        random_mock.return_value = 0.0
+        self.data_source._connected_websocket_assistant = AsyncMock(side_effect=Exception("connection failed"))
+        delays = self._record_sleeps(stop_after=2)
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.data_source.listen_for_user_stream(asyncio.Queue()))
+
+        min_backoff = CONSTANTS.USER_STREAM_BACKOFF_MIN_SECONDS
+        self.assertEqual([min_backoff * 0.5, min_backoff * 2 * 0.5], delays)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -90,6 +90,30 @@ class TestBackpackAuth(unittest.TestCase):
         )
         self.assertEqual(auth_string, expected)
 
+    def test_generate_auth_string_with_batch_params(self):
+        """Test auth string generation repeats the instruction for every item of a batch"""
+        instruction = "orderExecute"
+        params = [
+            {"symbol": "SOL_USDC", "side": "Bid", "quantity": "1.5"},
+            {"symbol": "SOL_USDC", "side": "Ask", "quantity": "2"},
+        ]
+        timestamp = 1614550000000
+        window = 5000
+
+        auth_string = self.auth.generate_auth_string(
+            instruction=instruction,
+            params=params,
+            timestamp=timestamp,
+            window=window
+        )
+
+        expected = (
+            "instruction=orderExecute&quantity=1.5&side=Bid&symbol=SOL_USDC&"
+            "instruction=orderExecute&quantity=2&side=Ask&symbol=SOL_USDC&"
+            "timestamp=1614550000000&window=5000"
+        )
+        self.assertEqual(auth_string, expected)
+
     def test_get_signature(self):
         """Test signature generation"""
         message = "test_message"
@@ -110,6 +134,8 @@ class TestBackpackAuth(unittest.TestCase):
             ("/api/v1/order", "POST", "orderExecute"),
             ("/api/v1/order", "DELETE", "orderCancel"),
             ("/api/v1/orders", None, "orderQueryAll"),
+            ("/api/v1/orders", "POST", "orderExecute"),
+            ("/api/v1/orders", "DELETE", "orderCancelAll"),
             ("/api/v1/fills", None, "fillHistoryQueryAll"),
             ("/api/v1/unknown", None, "accountQuery"),  # Default
         ]
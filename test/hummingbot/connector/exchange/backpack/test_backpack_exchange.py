@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
 from typing import Any, Dict, List
@@ -25,6 +26,7 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 
 
 class TestBackpackExchange(unittest.TestCase):
@@ -383,6 +385,398 @@ class TestBackpackExchange(unittest.TestCase):
         data_source = exchange_no_auth._create_user_stream_data_source()
         self.assertIsNone(data_source)
 
+    def test_update_balances_with_numeric_fields(self):
+        """Test balance parsing accepts both string and numeric JSON values"""
+        capital_response = {
+            "SOL": {"available": "1.5", "locked": 0.5, "staked": 0},
+            "USDC": {"available": 100, "locked": "0", "staked": "0"},
+        }
+        self.exchange._api_get = AsyncMock(side_effect=[capital_response, {}])
+
+        self.async_run_with_timeout(self.exchange._update_balances())
+
+        self.assertEqual(Decimal("2.0"), self.exchange._account_balances["SOL"])
+        self.assertEqual(Decimal("1.5"), self.exchange._account_available_balances["SOL"])
+        self.assertEqual(Decimal("100"), self.exchange._account_balances["USDC"])
+
+    def test_update_balances_reparses_only_changed_entries(self):
+        """Test repeated balance snapshots keep unchanged entries and pick up changed ones"""
+        first_response = {
+            "SOL": {"available": "1.5", "locked": "0.5", "staked": "0"},
+            "USDC": {"available": "100", "locked": "0", "staked": "0"},
+        }
+        second_response = {
+            "SOL": {"available": "1.5", "locked": "0.5", "staked": "0"},
+            "USDC": {"available": "80", "locked": "20", "staked": "0"},
+        }
+        self.exchange._api_get = AsyncMock(side_effect=[first_response, {}, second_response, {}])
+
+        self.async_run_with_timeout(self.exchange._update_balances())
+        self.async_run_with_timeout(self.exchange._update_balances())
+
+        self.assertEqual(Decimal("2.0"), self.exchange._account_balances["SOL"])
+        self.assertEqual(Decimal("1.5"), self.exchange._account_available_balances["SOL"])
+        self.assertEqual(Decimal("100"), self.exchange._account_balances["USDC"])
+        self.assertEqual(Decimal("80"), self.exchange._account_available_balances["USDC"])
+
+    def test_update_balances_updates_balance_dicts_in_place(self):
+        """Test balance snapshots are applied in place and drop assets no longer reported"""
+        balances = self.exchange._account_balances
+        available_balances = self.exchange._account_available_balances
+        balances["BTC"] = Decimal("1")
+        available_balances["BTC"] = Decimal("1")
+        capital_response = {"SOL": {"available": "1.5", "locked": "0.5", "staked": "0"}}
+        self.exchange._api_get = AsyncMock(side_effect=[capital_response, {}])
+
+        self.async_run_with_timeout(self.exchange._update_balances())
+
+        self.assertIs(balances, self.exchange._account_balances)
+        self.assertIs(available_balances, self.exchange._account_available_balances)
+        self.assertEqual({"SOL": Decimal("2.0")}, balances)
+        self.assertEqual({"SOL": Decimal("1.5")}, available_balances)
+
+    def test_recurring_polling_error_logs_traceback_once_per_interval(self):
+        """Test repeated errors from the same site only attach the traceback the first time"""
+        error = ValueError("boom")
+
+        self.exchange._log_error_with_sampled_traceback("update_balances", "Error updating balances.", error)
+        self.exchange._log_error_with_sampled_traceback("update_balances", "Error updating balances.", error)
+
+        error_records = [record for record in self.log_records if record.levelname == "ERROR"]
+        self.assertEqual(2, len(error_records))
+        self.assertEqual("Error updating balances. Error: boom", error_records[0].getMessage())
+        self.assertIsNotNone(error_records[0].exc_info)
+        self.assertFalse(error_records[1].exc_info)
+
+    def test_rest_url_is_built_once_per_path(self):
+        url = self.exchange._rest_url(CONSTANTS.ORDER_PATH_URL, True)
+
+        self.assertEqual(f"{CONSTANTS.REST_URL}{CONSTANTS.ORDER_PATH_URL}", url)
+        self.assertIs(url, self.exchange._rest_url(CONSTANTS.ORDER_PATH_URL, True))
+        self.assertIn((CONSTANTS.ORDER_PATH_URL, True), self.exchange._rest_url_cache)
+
+    def test_ws_order_update_resolves_order_through_exchange_id_index(self):
+        order_id = "1234"
+        self.exchange._order_tracker.start_tracking_order(
+            InFlightOrder(
+                client_order_id=order_id,
+                exchange_order_id="987654",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("100"),
+                amount=Decimal("1"),
+                creation_timestamp=1614550000
+            )
+        )
+
+        self.async_run_with_timeout(self.exchange._process_ws_order_update(
+            {"e": "orderAccepted", "i": "987654", "s": self.exchange_trading_pair, "E": 1614550001000}
+        ))
+        self.assertIs(self.exchange.in_flight_orders[order_id], self.exchange._exchange_id_index["987654"])
+
+        self.async_run_with_timeout(self.exchange._process_ws_order_update(
+            {"e": "orderCancelled", "i": "987654", "s": self.exchange_trading_pair, "E": 1614550002000}
+        ))
+        self.assertNotIn(order_id, self.exchange.in_flight_orders)
+        self.assertNotIn("987654", self.exchange._exchange_id_index)
+
+    def test_process_filled_order_update_skips_fills_request_when_fills_already_applied(self):
+        order = InFlightOrder(
+            client_order_id="1234",
+            exchange_order_id="987654",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+            creation_timestamp=1614550000
+        )
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        order_data = {"id": "987654", "status": "Filled", "executedQuantity": "1"}
+
+        self.async_run_with_timeout(self.exchange._process_order_update(order, order_data))
+        self.exchange._all_trade_updates_for_order.assert_awaited_once()
+
+        self.exchange._all_trade_updates_for_order.reset_mock()
+        order.executed_amount_base = Decimal("1")
+        self.async_run_with_timeout(self.exchange._process_order_update(order, order_data))
+        self.exchange._all_trade_updates_for_order.assert_not_awaited()
+
+    @patch("hummingbot.connector.exchange.backpack.backpack_exchange.random.random", return_value=0.5)
+    def test_user_stream_listener_backs_off_on_consecutive_errors(self, _):
+        async def events():
+            for event_type in ["bad", "bad", "good", "bad"]:
+                yield {"e": event_type}
+
+        self.exchange._iter_user_event_queue = events
+        self.exchange._user_stream_event_handlers = {
+            "bad": AsyncMock(side_effect=Exception("handler error")),
+            "good": AsyncMock(),
+        }
+        self.exchange._sleep = AsyncMock()
+
+        self.async_run_with_timeout(self.exchange._user_stream_event_listener())
+
+        sleep_delays = [call.args[0] for call in self.exchange._sleep.await_args_list]
+        self.assertEqual([1.0, 2.0, 1.0], sleep_delays)
+
+    def test_update_trading_rules_fills_symbol_map_from_same_markets_response(self):
+        markets = [
+            {
+                "symbol": self.exchange_trading_pair,
+                "marketType": "SPOT",
+                "orderBookState": "Open",
+                "filters": {
+                    "price": {"tickSize": "0.01"},
+                    "quantity": {"minQuantity": "0.01", "stepSize": "0.001"},
+                },
+            },
+            {"symbol": "BTC_USDC", "marketType": "SPOT", "orderBookState": "Open"},
+        ]
+        self.exchange._api_get = AsyncMock(return_value=markets)
+
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        self.exchange._api_get.assert_awaited_once_with(path_url=CONSTANTS.MARKETS_PATH_URL, is_auth_required=False)
+        self.assertIn(self.trading_pair, self.exchange._trading_rules)
+        self.assertTrue(self.exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(self.trading_pair, self.exchange._trading_pair_symbol_map[self.exchange_trading_pair])
+        self.assertEqual("BTC-USDC", self.exchange._trading_pair_symbol_map["BTC_USDC"])
+
+    def test_update_trading_rules_reuses_rules_of_unchanged_markets(self):
+        market = {
+            "symbol": self.exchange_trading_pair,
+            "marketType": "SPOT",
+            "orderBookState": "Open",
+            "filters": {
+                "price": {"tickSize": "0.01"},
+                "quantity": {"minQuantity": "0.01", "stepSize": "0.001"},
+            },
+        }
+        self.exchange._make_trading_rules_request = AsyncMock(return_value=[market])
+
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+        first_rule = self.exchange._trading_rules[self.trading_pair]
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        self.assertIs(first_rule, self.exchange._trading_rules[self.trading_pair])
+
+        market["filters"]["price"]["tickSize"] = "0.1"
+        self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        self.assertEqual(Decimal("0.1"), self.exchange._trading_rules[self.trading_pair].min_price_increment)
+        self.assertEqual(1, len(self.exchange._trading_rules_by_fingerprint))
+
+    def test_ws_order_update_without_event_time_uses_current_timestamp(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._order_tracker.start_tracking_order(
+            InFlightOrder(
+                client_order_id="1234",
+                exchange_order_id="987654",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("100"),
+                amount=Decimal("1"),
+                creation_timestamp=1640779000
+            )
+        )
+
+        self.async_run_with_timeout(self.exchange._process_ws_order_update(
+            {"e": "orderAccepted", "i": "987654", "s": self.exchange_trading_pair}
+        ))
+
+        self.assertEqual(1640780000, self.exchange.in_flight_orders["1234"].last_update_timestamp)
+
+    def _submit_orders_in_one_window(self, *orders_data):
+        async def submit():
+            return await asyncio.gather(
+                *[self.exchange._submit_order_request(order_data) for order_data in orders_data],
+                return_exceptions=True
+            )
+        return self.async_run_with_timeout(submit())
+
+    def test_batched_orders_in_one_window_are_sent_in_one_request(self):
+        self.exchange._batch_orders_enabled = True
+        self.exchange._api_post = AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+
+        results = self._submit_orders_in_one_window({"clientId": 1}, {"clientId": 2})
+
+        self.assertEqual([{"id": "1"}, {"id": "2"}], results)
+        self.exchange._api_post.assert_awaited_once_with(
+            path_url=CONSTANTS.BATCH_ORDER_PATH_URL,
+            data=[{"clientId": 1}, {"clientId": 2}],
+            is_auth_required=True
+        )
+        self.assertEqual([], self.exchange._pending_order_requests)
+
+    def test_single_batched_order_is_sent_to_order_endpoint(self):
+        self.exchange._batch_orders_enabled = True
+        self.exchange._api_post = AsyncMock(return_value={"id": "1"})
+
+        results = self._submit_orders_in_one_window({"clientId": 1})
+
+        self.assertEqual([{"id": "1"}], results)
+        self.exchange._api_post.assert_awaited_once_with(
+            path_url=CONSTANTS.ORDER_PATH_URL,
+            data={"clientId": 1},
+            is_auth_required=True
+        )
+
+    def test_batched_orders_are_chunked_at_max_batch_size(self):
+        self.exchange._batch_orders_enabled = True
+        self.exchange._api_post = AsyncMock(
+            side_effect=lambda path_url, data, is_auth_required: [{"id": order["clientId"]} for order in data]
+        )
+        orders_data = [{"clientId": i} for i in range(CONSTANTS.BATCH_ORDER_MAX_SIZE + 2)]
+
+        results = self._submit_orders_in_one_window(*orders_data)
+
+        self.assertEqual([{"id": i} for i in range(CONSTANTS.BATCH_ORDER_MAX_SIZE + 2)], results)
+        self.assertEqual(2, self.exchange._api_post.await_count)
+
+    def test_batch_request_error_fails_every_pending_order(self):
+        self.exchange._batch_orders_enabled = True
+        error = IOError("Error executing request POST url. HTTP status is 500.")
+        self.exchange._api_post = AsyncMock(side_effect=error)
+
+        results = self._submit_orders_in_one_window({"clientId": 1}, {"clientId": 2})
+
+        self.assertEqual([error, error], results)
+
+    def test_short_batch_response_fails_every_pending_order(self):
+        self.exchange._batch_orders_enabled = True
+        self.exchange._api_post = AsyncMock(return_value=[{"id": "1"}])
+
+        results = self._submit_orders_in_one_window({"clientId": 1}, {"clientId": 2})
+
+        self.assertEqual(2, len(results))
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_markets_response_is_cached_and_shared(self):
+        markets = self.get_exchange_rules_mock()
+        self.exchange._api_get = AsyncMock(return_value=markets)
+
+        async def concurrent_requests():
+            return await asyncio.gather(
+                self.exchange._make_trading_rules_request(),
+                self.exchange._make_trading_pairs_request(),
+            )
+
+        self.assertEqual([markets, markets], self.async_run_with_timeout(concurrent_requests()))
+        self.assertEqual(markets, self.async_run_with_timeout(self.exchange._make_trading_rules_request()))
+        self.exchange._api_get.assert_awaited_once_with(path_url=CONSTANTS.MARKETS_PATH_URL, is_auth_required=False)
+
+        self.exchange._markets_cache_timestamp -= CONSTANTS.MARKETS_CACHE_TTL
+        self.async_run_with_timeout(self.exchange._make_trading_pairs_request())
+
+        self.assertEqual(2, self.exchange._api_get.await_count)
+
+    def test_numeric_client_id(self):
+        self.assertEqual(1234, self.exchange._numeric_client_id("1234"))
+        self.assertEqual(1234, self.exchange._numeric_client_id("HBOT-1234"))
+        self.assertEqual(4294967295, self.exchange._numeric_client_id("4294967295"))
+        self.assertIsNone(self.exchange._numeric_client_id("4294967296"))
+        self.assertIsNone(self.exchange._numeric_client_id("HBOT-abc"))
+        self.assertIsNone(self.exchange._numeric_client_id(""))
+
+    def test_update_order_status_skips_recently_updated_orders_while_user_stream_is_active(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._user_stream_tracker = MagicMock(last_recv_time=1640779990)
+        self.exchange._order_tracker.start_tracking_order(
+            InFlightOrder(
+                client_order_id="1234",
+                exchange_order_id="987654",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("100"),
+                amount=Decimal("1"),
+                creation_timestamp=1640779995
+            )
+        )
+        self.exchange._api_get = AsyncMock(return_value=[])
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.exchange._api_get.assert_not_called()
+
+    def test_is_retryable_request_error(self):
+        """Test that only transient request failures are retried"""
+        self.assertTrue(self.exchange._is_retryable_request_error(asyncio.TimeoutError()))
+        self.assertTrue(self.exchange._is_retryable_request_error(
+            IOError("Error executing request GET url. HTTP status is 429. Error: Too Many Requests")))
+        self.assertTrue(self.exchange._is_retryable_request_error(
+            IOError("Error executing request GET url. HTTP status is 503. Error: N/A")))
+        self.assertFalse(self.exchange._is_retryable_request_error(
+            IOError("Error executing request GET url. HTTP status is 400. Error: INVALID_ORDER")))
+        self.assertFalse(self.exchange._is_retryable_request_error(PermissionError("Unauthorized")))
+        self.assertFalse(self.exchange._is_retryable_request_error(ValueError("Invalid JSON")))
+
+    def test_rate_limit_error_opens_shared_backoff_window(self):
+        """Test a rate limited request holds off later requests until the backoff window ends"""
+        rate_limit_error = IOError("Error executing request GET url. HTTP status is 429. Error: Too Many Requests")
+        rest_assistant = MagicMock()
+        rest_assistant.execute_request_and_get_response = AsyncMock(side_effect=rate_limit_error)
+        self.exchange._sleep = AsyncMock()
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._execute_rest_request(
+                rest_assistant, method=RESTMethod.POST, url="url", throttler_limit_id="limit_id"))
+
+        self.assertGreater(self.exchange._rate_limited_until, 0)
+        self.exchange._sleep.assert_not_awaited()
+
+        response = AsyncMock()
+        response.text.return_value = json.dumps({"status": "ok"})
+        rest_assistant.execute_request_and_get_response = AsyncMock(return_value=response)
+
+        result = self.async_run_with_timeout(self.exchange._execute_rest_request(
+            rest_assistant, method=RESTMethod.GET, url="url", throttler_limit_id="limit_id"))
+
+        self.assertEqual({"status": "ok"}, result)
+        self.exchange._sleep.assert_awaited_once()
+
+    def test_successive_rate_limit_errors_widen_backoff_window(self):
+        """Test repeated rate limit errors widen the shared backoff window and a success resets it"""
+        rate_limit_error = IOError("Error executing request POST url. HTTP status is 429. Error: Too Many Requests")
+        rest_assistant = MagicMock()
+        rest_assistant.execute_request_and_get_response = AsyncMock(side_effect=rate_limit_error)
+        self.exchange._sleep = AsyncMock()
+
+        for _ in range(8):
+            with self.assertRaises(IOError):
+                self.async_run_with_timeout(self.exchange._execute_rest_request(
+                    rest_assistant, method=RESTMethod.POST, url="url", throttler_limit_id="limit_id"))
+
+        self.assertEqual(8, self.exchange._successive_rate_limit_errors)
+        self.assertGreater(self.exchange._rate_limited_until, time.time() + 16)
+        self.assertLessEqual(
+            self.exchange._rate_limited_until, time.time() + CONSTANTS.RATE_LIMIT_MAX_BACKOFF_SECONDS)
+
+        response = AsyncMock()
+        response.text.return_value = json.dumps({"status": "ok"})
+        rest_assistant.execute_request_and_get_response = AsyncMock(return_value=response)
+        self.async_run_with_timeout(self.exchange._execute_rest_request(
+            rest_assistant, method=RESTMethod.POST, url="url", throttler_limit_id="limit_id"))
+
+        self.assertEqual(0, self.exchange._successive_rate_limit_errors)
+
+    def test_exchange_symbol_associated_to_pair(self):
+        """Test trading pair to exchange symbol resolution from the symbol map"""
+        self.exchange._initialize_trading_pair_symbols_from_exchange_info(
+            [{"symbol": self.exchange_trading_pair}, {"symbol": "BTC_USDC"}]
+        )
+
+        symbol = self.async_run_with_timeout(self.exchange.exchange_symbol_associated_to_pair(self.trading_pair))
+        self.assertEqual(self.exchange_trading_pair, symbol)
+
+        trading_pair = self.async_run_with_timeout(
+            self.exchange.trading_pair_associated_to_exchange_symbol("BTC_USDC"))
+        self.assertEqual("BTC-USDC", trading_pair)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
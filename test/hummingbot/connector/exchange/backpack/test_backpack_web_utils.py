@@ -50,6 +50,13 @@ class TestBackpackWebUtils(unittest.TestCase):
         self.assertIsInstance(api_factory, WebAssistantsFactory)
         self.assertEqual(api_factory._auth, mock_auth)
 
+    def test_build_api_factory_shares_connections_factory(self):
+        """Test that every API factory reuses the same Backpack connections factory"""
+        first_factory = web_utils.build_api_factory(throttler=self.throttler)
+        second_factory = web_utils.build_api_factory(throttler=self.throttler)
+        self.assertIsInstance(first_factory._connections_factory, web_utils.BackpackConnectionsFactory)
+        self.assertIs(first_factory._connections_factory, second_factory._connections_factory)
+
     def test_build_api_factory_without_time_synchronizer(self):
         """Test API factory creation without time synchronizer"""
         api_factory = web_utils.build_api_factory(throttler=self.throttler)